@@ -1,11 +1,49 @@
 import time
+from itertools import batched
+from typing import Iterable
 
-from utils import read_data
+from utils import InputStream, stream_lines
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def part_one(ops: list[int]) -> int:
-    num_zeroes = 0
+# How many ops the numpy path handles at once, so even a huge op log never has to be in memory all at the same time
+BATCH_SIZE = 1 << 20
+
+
+def zeroes_passed(cur_val: int, op: int) -> int:
+    # The number of multiples of 100 the op covers, counting where it starts but not where it ends (same as walking
+    # range(cur_val, cur_val + op, step) one click at a time), worked out with floor division instead
+    if op > 0:
+        return (cur_val + op - 1) // 100 - (cur_val - 1) // 100
+    return cur_val // 100 - (cur_val + op) // 100
+
+
+# Biggest op the numpy path takes: the dial position (under 100) plus the op still has to fit in an int64
+INT64_SAFE = 2**63 - 100
+
+
+def batch_positions(ops: Iterable[int]) -> Iterable[tuple["np.ndarray | tuple[int, ...]", "np.ndarray | int"]]:
+    # Yields (ops, starting dial positions) for each batch.  The running sum only ever adds up ops mod 100, so it can't
+    # overflow however big the rotations get.  A batch with an op too big for int64 comes back as plain ints instead,
+    # with just the dial position it starts from, for the integer path to handle.
     cur_val = 50
+    for batch in batched(ops, BATCH_SIZE):
+        if not (-INT64_SAFE < min(batch) and max(batch) < INT64_SAFE):
+            yield batch, cur_val
+            cur_val = (cur_val + sum(batch)) % 100
+            continue
+        batch = np.array(batch, dtype=np.int64)
+        steps = batch % 100
+        starts = (cur_val + np.cumsum(steps) - steps) % 100
+        yield batch, starts
+        cur_val = int(starts[-1] + steps[-1]) % 100
+
+
+def landed_on_zero(ops: Iterable[int], cur_val: int = 50) -> int:
+    num_zeroes = 0
     for op in ops:
         cur_val += op
         cur_val %= 100
@@ -14,21 +52,49 @@ def part_one(ops: list[int]) -> int:
     return num_zeroes
 
 
-def part_two(ops: list[int]) -> int:
+def passed_zero(ops: Iterable[int], cur_val: int = 50) -> int:
     num_zeroes = 0
-    cur_val = 50
     for op in ops:
-        # make an array of all the numbers the op covers, filter it down to just the zeroes, and count it
-        zeroes_in_op = sum(1 for x in range(cur_val, cur_val + op, op // abs(op)) if x % 100 == 0)
-        num_zeroes += zeroes_in_op
+        num_zeroes += zeroes_passed(cur_val, op)
         cur_val += op
         cur_val %= 100
     return num_zeroes
 
 
-def main():
+def part_one(ops: Iterable[int]) -> int:
+    if np is None:
+        return landed_on_zero(ops)
+    num_zeroes = 0
+    for batch, starts in batch_positions(ops):
+        if isinstance(starts, int):
+            num_zeroes += landed_on_zero(batch, starts)
+        else:
+            num_zeroes += int(np.count_nonzero((starts + batch) % 100 == 0))
+    return num_zeroes
+
+
+def part_two(ops: Iterable[int]) -> int:
+    if np is None:
+        return passed_zero(ops)
+    num_zeroes = 0
+    for batch, starts in batch_positions(ops):
+        if isinstance(starts, int):
+            num_zeroes += passed_zero(batch, starts)
+        else:
+            ends = starts + batch
+            passed = np.where(batch > 0, (ends - 1) // 100 - (starts - 1) // 100, starts // 100 - ends // 100)
+            num_zeroes += int(passed.sum())
+    return num_zeroes
+
+
+def parse() -> InputStream[int]:
     # Change L/R to -/+ before converting each line to an int so I don't have to do special processing
-    ops = [int(x.translate(str.maketrans("LR", "-+"))) for x in read_data().splitlines()]
+    sign_table = str.maketrans("LR", "-+")
+    return stream_lines().map(lambda x: int(x.translate(sign_table)))
+
+
+def main():
+    ops = parse()
     print(f"Part one: {part_one(ops)}")
     print(f"Part two: {part_two(ops)}")
 
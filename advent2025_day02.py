@@ -1,56 +1,69 @@
 import time
-from math import floor
+from itertools import combinations
+from math import prod
 from typing import Iterable
 
-from utils import read_data
+from utils import InputStream, stream_tokens
 
 
-def repeats(startval: int, num_repeats: int) -> Iterable[int]:
-    curval = startval
-    start_len = len(str(curval))
-    while len(str(curval)) == start_len:
-        yield int(f"{curval}" * num_repeats)
-        curval += 1
+def periodic_sum(start: int, stop: int, num_digits: int, period: int) -> int:
+    # Every num_digits-long number made of a period-long block repeated is seed * multiplier, e.g. 123123 = 123 * 1001,
+    # so the ones in [start, stop] are an arithmetic series over the seeds and can be summed without listing them
+    multiplier = (10**num_digits - 1) // (10**period - 1)
+    low = max(-(-start // multiplier), 10 ** (period - 1))
+    high = min(stop // multiplier, 10**period - 1)
+    if low > high:
+        return 0
+    return multiplier * (low + high) * (high - low + 1) // 2
 
 
-def invalids_in_range(span: range) -> Iterable[tuple[int, int]]:
-    start_str = str(span.start)
-    stop_len = len(str(span.stop - 1))
-    seen_repeats = set()
-    # This checks all the possible lengths, e.g. it checks 2, 3, and 4 if the range is 10-1000
-    for num_digits in range(len(start_str), stop_len + 1):
-        # Check longer repeat lengths first to make sure double repeats don't get eaten by seen_repeats
-        for repeat_length in reversed(range(1, floor(stop_len / 2) + 1)):
-            # We only test lengths that divide evenly into the number of digits, and there has to be at least 2 repeats
-            if num_digits % repeat_length != 0 or num_digits // repeat_length < 2:
-                continue
-            # For the smallest number of digits we can start testing for repeats based on the start of the range
-            # If we're at a larger number of digits, we start where it rolls over, e.g. 10000 for a 5-length number
-            test_start = int(start_str[:repeat_length]) if num_digits == len(start_str) else pow(10, repeat_length - 1)
-            for to_test in repeats(test_start, num_digits // repeat_length):
-                if to_test < span.start or to_test in seen_repeats:
-                    continue
-                if to_test >= span.stop:
-                    break
-                seen_repeats.add(to_test)
-                yield to_test, num_digits // repeat_length
+def prime_factors(num: int) -> list[int]:
+    factors, factor = [], 2
+    while num > 1:
+        if num % factor == 0:
+            factors.append(factor)
+            while num % factor == 0:
+                num //= factor
+        factor += 1
+    return factors
 
 
-def double_repeats(spans: list[range]) -> Iterable[int]:
-    for span in spans:
-        yield from (x[0] for x in invalids_in_range(span) if x[1] == 2)
+def repeats_sum(span: range, doubles_only: bool = False) -> int:
+    start, stop = span.start, span.stop - 1
+    total = 0
+    for num_digits in range(len(str(start)), len(str(stop)) + 1):
+        if doubles_only:
+            if num_digits % 2 == 0:
+                total += periodic_sum(start, stop, num_digits, num_digits // 2)
+            continue
+        # Every repeat has a period of num_digits / p for some prime p, so those periods cover everything.  A number
+        # with two of them as periods also repeats with the smaller period num_digits / (p1 * p2), so inclusion-exclusion
+        # over sets of primes counts each number exactly once.
+        primes = prime_factors(num_digits)
+        for num_primes in range(1, len(primes) + 1):
+            for combo in combinations(primes, num_primes):
+                sign = 1 if num_primes % 2 else -1
+                total += sign * periodic_sum(start, stop, num_digits, num_digits // prod(combo))
+    return total
 
 
-def all_repeats(spans: list[range]) -> Iterable[int]:
-    for span in spans:
-        yield from (x[0] for x in invalids_in_range(span))
+def parse() -> InputStream[range]:
+    range_strs = stream_tokens(",").map(lambda x: x.split("-"))
+    return range_strs.map(lambda x: range(int(x[0]), int(x[1]) + 1))
+
+
+def part_one(ranges: Iterable[range]) -> int:
+    return sum(repeats_sum(x, doubles_only=True) for x in ranges)
+
+
+def part_two(ranges: Iterable[range]) -> int:
+    return sum(repeats_sum(x) for x in ranges)
 
 
 def main():
-    range_strs = [x.split("-") for x in read_data().split(",")]
-    ranges = [range(int(x[0]), int(x[1]) + 1) for x in range_strs]
-    print(f"Part one: {sum(double_repeats(ranges))}")
-    print(f"Part two: {sum(all_repeats(ranges))}")
+    ranges = parse()
+    print(f"Part one: {part_one(ranges)}")
+    print(f"Part two: {part_two(ranges)}")
 
 
 if __name__ == "__main__":
@@ -1,34 +1,86 @@
-from utils import read_data
+from mmap import mmap
+
+from utils import read_bytes
 import time
 
+# Digits from largest to smallest (0 included) along with their characters, for searching raw bytes directly
+DIGITS_DESCENDING = tuple((x, str(x).encode()) for x in range(9, -1, -1))
+
+
+def raw_bank_joltage(raw: bytes | mmap, start: int, end: int, num_batteries: int) -> int:
+    # Each pick is the leftmost largest digit in the window that still leaves room for the rest, found with find()
+    # calls that scan the bytes in C.  That's O(10 * batteries * bank length) at worst, against O(bank length) for a
+    # monotonic stack, but in practice a 9 or 8 turns up within a few bytes, and keeping the scanning in C beats a
+    # one-pass Python loop over every digit by several times up to a dozen or so batteries.
+    joltage, pos = 0, start
+    for remaining in reversed(range(num_batteries)):
+        for digit, char in DIGITS_DESCENDING:
+            found = raw.find(char, pos, end - remaining)
+            if found != -1:
+                joltage = joltage * 10 + digit
+                pos = found + 1
+                break
+    return joltage
+
+
+def largest_joltage(bank: bytes | mmap, start: int, end: int, num_batteries: int) -> int:
+    # Monotonic stack in one pass: a digit knocks out smaller ones before it while we can still afford to drop them,
+    # and once the stack is full any digit that can't knock something out is the one dropped.  O(bank length) no
+    # matter how many batteries, which is what counts once they're a sizable share of the bank.
+    can_drop, stack = end - start - num_batteries, []
+    for pos in range(start, end):
+        digit = bank[pos] - 48
+        while can_drop and stack and stack[-1] < digit:
+            stack.pop()
+            can_drop -= 1
+        if len(stack) < num_batteries:
+            stack.append(digit)
+        else:
+            can_drop -= 1
+    # Fold in 18-digit chunks that stay machine-sized, so a huge battery count does 1/18th the big-int multiplies
+    joltage = 0
+    for chunk_start in range(0, len(stack), 18):
+        chunk, chunk_end = 0, min(chunk_start + 18, len(stack))
+        for pos in range(chunk_start, chunk_end):
+            chunk = chunk * 10 + stack[pos]
+        joltage = joltage * 10 ** (chunk_end - chunk_start) + chunk
+    return joltage
+
+
+def total_joltage(raw: bytes | mmap, num_batteries: int) -> int:
+    # Works straight off the raw input, one bank per line, without decoding or splitting anything
+    total, start = 0, 0
+    while start < len(raw):
+        end = raw.find(b"\n", start)
+        end = len(raw) if end == -1 else end
+        if end > start:
+            # find() wins while the batteries are a small share of the bank, the stack once they're a large one
+            if num_batteries > 12 or num_batteries * 10 > end - start:
+                total += largest_joltage(raw, start, end, num_batteries)
+            else:
+                total += raw_bank_joltage(raw, start, end, num_batteries)
+        start = end + 1
+    return total
+
+
+def parse() -> bytes | mmap:
+    # read_bytes hands back a view over the mmapped file, and the mmap itself is what has find()
+    raw = read_bytes()
+    return raw.obj if isinstance(raw.obj, mmap) else bytes(raw)
+
 
-def leftmost_largest(digits: list[int]) -> tuple[int, int]:
-    max_digit = min_pos = -1
-    for i, digit in enumerate(digits):
-        if digit > max_digit:
-            min_pos, max_digit = i, int(digit)
-        if max_digit == 9:
-            break
-    return min_pos, max_digit
+def part_one(raw: bytes | mmap) -> int:
+    return total_joltage(raw, num_batteries=2)
 
 
-def largest_joltage(bank: list[int], num_batteries: int = 2) -> int:
-    final_digits = []
-    pos = 0
-    for i in range(1, num_batteries + 1):
-        # Start at the previous position and leave room for the rest of the batteries
-        newpos, digit = leftmost_largest(bank[pos : len(bank) - (num_batteries - i)])
-        final_digits.append(digit)
-        # Advance our position past the newly-found leftmost largest digit
-        pos = pos + newpos + 1
-    # Cheeky/lazy way to assemble/stitch the digits together
-    return int("".join(str(x) for x in final_digits))
+def part_two(raw: bytes | mmap) -> int:
+    return total_joltage(raw, num_batteries=12)
 
 
 def main():
-    banks = [[int(x) for x in line] for line in read_data().splitlines()]
-    print(f"Part one: {sum(largest_joltage(x, num_batteries=2) for x in banks)}")
-    print(f"Part two: {sum(largest_joltage(x, num_batteries=12) for x in banks)}")
+    raw = parse()
+    print(f"Part one: {part_one(raw)}")
+    print(f"Part two: {part_two(raw)}")
 
 
 if __name__ == "__main__":
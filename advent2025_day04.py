@@ -1,42 +1,73 @@
 import time
 from typing import Iterable
 
-from utils import BaseCoord as Coord
-from utils import read_data
+from utils import Grid, cached_parse, count, read_bytes
 
+ROLL, EMPTY = ord("@"), ord(".")
 
-def calc_neighbors(grid: dict[Coord, set[Coord]]):
-    for coord in grid:
-        grid[coord] = {x for x in coord.neighbors() if x in grid}
 
+def calc_neighbors(grid: Grid) -> bytearray:
+    # Neighbor counts live in a bytearray laid out just like the grid, indexed by the same flat cell index
+    cells = grid.cells
+    neighbors = bytearray(len(cells))
+    for pos in grid.find(ROLL):
+        neighbors[pos] = sum(1 for offset in grid.all_offsets if cells[pos + offset] == ROLL)
+    return neighbors
 
-def recalc_neighbors(grid: dict[Coord, set[Coord]], removed: Iterable[Coord]):
+
+def recalc_neighbors(grid: Grid, neighbors: bytearray, removed: Iterable[int]) -> list[int]:
+    cells = grid.cells
+    # Clear everything first so rolls being removed together don't bother updating each other
+    for pos in removed:
+        cells[pos] = EMPTY
+    # Only rolls next to a removed one can change, and each one becomes removable exactly once: when its count
+    # drops from 4 to 3.  Those make up the next round, so nothing ever needs to rescan the whole grid.
+    newly_removable = []
     for pos in removed:
-        for neighbor in grid[pos]:
-            grid[neighbor].discard(pos)
+        for offset in grid.all_offsets:
+            if cells[pos + offset] == ROLL:
+                neighbors[pos + offset] -= 1
+                if neighbors[pos + offset] == 3:
+                    newly_removable.append(pos + offset)
+    return newly_removable
+
+
+def peel(grid: Grid, neighbors: bytearray) -> list[int]:
+    # Removes rolls round by round until none can go (a k-core peel, with k=4), returning how many went each round.
+    # Every roll gets removed at most once and each removal touches 8 neighbors, so this is linear in the grid size.
+    rounds = []
+    can_remove = [x for x in grid.find(ROLL) if neighbors[x] < 4]
+    while can_remove:
+        count("day04.rounds")
+        rounds.append(len(can_remove))
+        can_remove = recalc_neighbors(grid, neighbors, can_remove)
+    return rounds
+
 
+def read_grid(raw_grid: str | bytes | memoryview) -> tuple[Grid, bytearray]:
+    grid = Grid.from_text(raw_grid, fill=EMPTY)
+    return grid, calc_neighbors(grid)
 
-def read_grid(raw_grid: str) -> dict[Coord, set[Coord]]:
-    grid = {}
-    for y, line in enumerate(raw_grid.splitlines()):
-        for x, char in enumerate(line):
-            if char == "@":
-                grid[Coord(x=x, y=y)] = set()
-    calc_neighbors(grid)
-    return grid
+
+@cached_parse
+def parse() -> tuple[Grid, bytearray]:
+    return read_grid(read_bytes())
+
+
+def part_one(parsed: tuple[Grid, bytearray]) -> int:
+    grid, neighbors = parsed
+    return sum(1 for x in grid.find(ROLL) if neighbors[x] < 4)
+
+
+def part_two(parsed: tuple[Grid, bytearray]) -> int:
+    # Note that this removes rolls from the grid as it goes
+    return sum(peel(*parsed))
 
 
 def main():
-    grid = read_grid(read_data())
-    can_remove = [k for k, v in grid.items() if len(v) < 4]
-    print(f"Part one: {len(can_remove)}")
-    total_removed = 0
-    while can_remove:
-        total_removed += len(can_remove)
-        recalc_neighbors(grid, can_remove)
-        [grid.pop(x) for x in can_remove]
-        can_remove = [k for k, v in grid.items() if len(v) < 4]
-    print(f"Part two: {total_removed}")
+    parsed = parse()
+    print(f"Part one: {part_one(parsed)}")
+    print(f"Part two: {part_two(parsed)}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 import time
+from bisect import bisect_right
+from itertools import batched, dropwhile, takewhile
+from typing import Iterable
 
-from utils import read_data
+from utils import InputStream, stream_lines
 
 
 def merge_ranges(ranges: list[range]) -> list[range]:
@@ -13,15 +16,65 @@ def merge_ranges(ranges: list[range]) -> list[range]:
     return merged_ranges
 
 
-def main():
-    raw_ranges, raw_ingredients = read_data().split("\n\n")
-    fresh_ranges = [range(int(x.split("-")[0]), int(x.split("-")[1]) + 1) for x in raw_ranges.splitlines()]
+# How many ingredients get sorted together at a time when checking in bulk
+BATCH_SIZE = 1 << 16
+
+
+class RangeIndex:
+    # The merged ranges, kept as flat sorted lists of starts and (exclusive) stops so lookups can binary search them
+    def __init__(self, merged_ranges: list[range]):
+        self.starts = [x.start for x in merged_ranges]
+        self.stops = [x.stop for x in merged_ranges]
+
+    def __contains__(self, value: int) -> bool:
+        # The only range that could hold the value is the last one starting at or before it
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value < self.stops[i]
+
+    def total_size(self) -> int:
+        return sum(stop - start for start, stop in zip(self.starts, self.stops))
+
+    def count_contained(self, values: Iterable[int]) -> int:
+        # Sorts the values a batch at a time and walks them alongside the ranges, so each batch costs a sort plus one
+        # pass, and the values can come from a stream of any length
+        starts, stops = self.starts, self.stops
+        total = 0
+        for batch in batched(values, BATCH_SIZE):
+            i = 0
+            for value in sorted(batch):
+                while i < len(stops) and stops[i] <= value:
+                    i += 1
+                if i == len(stops):
+                    break
+                if value >= starts[i]:
+                    total += 1
+        return total
+
+
+def parse() -> tuple[RangeIndex, InputStream[int]]:
+    lines = stream_lines()
+    # The ranges run up to the first blank line, and everything after it is an ingredient
+    raw_ranges = takewhile(bool, lines)
+    fresh_ranges = [range(int(x.split("-")[0]), int(x.split("-")[1]) + 1) for x in raw_ranges]
     fresh_ranges = sorted(fresh_ranges, key=lambda x: x.start)
-    merged_ranges = merge_ranges(fresh_ranges)
-    ingredients = [int(x) for x in raw_ingredients.splitlines()]
-    fresh_ingredients = [x for x in ingredients if any(x in merged_range for merged_range in merged_ranges)]
-    print(f"Part one: {len(fresh_ingredients)}")
-    print(f"Part two: {sum(len(x) for x in merged_ranges)}")
+    ingredients = InputStream(lambda: (int(x) for x in dropwhile(bool, lines) if x))
+    return RangeIndex(merge_ranges(fresh_ranges)), ingredients
+
+
+def part_one(parsed: tuple[RangeIndex, Iterable[int]]) -> int:
+    fresh, ingredients = parsed
+    return fresh.count_contained(ingredients)
+
+
+def part_two(parsed: tuple[RangeIndex, Iterable[int]]) -> int:
+    fresh, _ = parsed
+    return fresh.total_size()
+
+
+def main():
+    parsed = parse()
+    print(f"Part one: {part_one(parsed)}")
+    print(f"Part two: {part_two(parsed)}")
 
 
 if __name__ == "__main__":
@@ -1,22 +1,74 @@
+import re
 import time
-from itertools import groupby
 from math import prod
+from typing import NamedTuple
 
-from utils import read_data
+from utils import read_bytes
+
+
+OPCODES = {"+": sum, "*": prod}
+
+# Turns spaces into zero bytes, so OR-ing rows together as big ints leaves a zero byte only in all-blank columns
+BLANKS_TO_ZERO = bytes.maketrans(b" ", b"\0")
+PROBLEM_COLUMNS = re.compile(rb"[^\0]+")
+
+
+class Problem(NamedTuple):
+    start: int
+    stop: int
+    op: str
+
+
+class Worksheet(NamedTuple):
+    # The raw sheet, with every line the same length so a cell is always at row * stride + column
+    data: bytes
+    stride: int
+    num_rows: int
+    problems: list[Problem]
+
+    def row_operands(self, problem: Problem) -> list[int]:
+        # int() is happy to skip the padding spaces around each number itself
+        return [
+            int(self.data[row * self.stride + problem.start : row * self.stride + problem.stop])
+            for row in range(self.num_rows)
+        ]
+
+    def column_operands(self, problem: Problem) -> list[int]:
+        # A strided slice pulls one column straight down the operand rows
+        return [
+            int(self.data[column : column + self.num_rows * self.stride : self.stride])
+            for column in range(problem.start, problem.stop)
+        ]
+
+
+def parse() -> Worksheet:
+    data = read_bytes().obj
+    stride = data.find(b"\n") + 1
+    # The last line may or may not end in a newline
+    num_rows = (len(data) + 1) // stride - 1
+    width = stride - 1
+    occupied = 0
+    for row in range(num_rows):
+        occupied |= int.from_bytes(data[row * stride : row * stride + width].translate(BLANKS_TO_ZERO))
+    columns = occupied.to_bytes(width)
+    # Every problem has exactly one operator, so they line up with the runs of occupied columns
+    ops = data[num_rows * stride : num_rows * stride + width].decode().split()
+    problems = [Problem(*x.span(), op) for x, op in zip(PROBLEM_COLUMNS.finditer(columns), ops)]
+    return Worksheet(data, stride, num_rows, problems)
+
+
+def part_one(parsed: Worksheet) -> int:
+    return sum(OPCODES[x.op](parsed.row_operands(x)) for x in parsed.problems)
+
+
+def part_two(parsed: Worksheet) -> int:
+    return sum(OPCODES[x.op](parsed.column_operands(x)) for x in parsed.problems)
 
 
 def main():
-    *raw_lines, ops = read_data().splitlines()
-    raw_columns = zip(*raw_lines)
-    grouped_columns = [list(g) for k, g in groupby(raw_columns, key=lambda x: any(c != " " for c in x)) if k]
-    grouped_row_ints = [[int("".join(row)) for row in zip(*x)] for x in grouped_columns]
-    ops = [op.strip() for op in ops.split()]
-    opcodes = {"+": sum, "*": prod}
-    p1_total = sum(opcodes[ops[i]](x) for i, x in enumerate(grouped_row_ints))
-    print(f"Part one: {p1_total}")
-    grouped_col_ints = [[int("".join(column)) for column in x] for x in grouped_columns]
-    p2_total = sum(opcodes[ops[i]](x) for i, x in enumerate(grouped_col_ints))
-    print(f"Part two: {p2_total}")
+    parsed = parse()
+    print(f"Part one: {part_one(parsed)}")
+    print(f"Part two: {part_two(parsed)}")
 
 
 if __name__ == "__main__":
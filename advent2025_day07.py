@@ -1,41 +1,82 @@
-from collections import defaultdict
+from itertools import islice
+from typing import Iterable
 
-from utils import read_data
+from utils import InputStream, stream_lines
 import time
 
+# Splitters become 1 bits, so reversing a line gives the binary form of a mask where bit x is column x
+SPLITTER_BITS = str.maketrans("^.", "10")
 
-def read_grid(raw_grid: str) -> tuple[int, list[set[int]]]:
-    first_line, *other_lines = raw_grid.splitlines()
-    start_x = first_line.index("S")
-    layers = [{i for i, x in enumerate(line) if x == "^"} for line in other_lines]
-    # Filter out empty layers
-    return start_x, [x for x in layers if x]
 
-def propagate_layers(start_x: int, layers: list[set[int]]) -> int:
-    active_columns = {start_x}
+def layer_mask(line: str) -> int:
+    return int(line.translate(SPLITTER_BITS)[::-1] or "0", 2)
+
+
+def set_bits(mask: int) -> Iterable[int]:
+    # Finding the 1s in the binary string keeps the scan in C, rather than peeling bits off a huge int one at a time
+    bits = bin(mask)[:1:-1]
+    i = bits.find("1")
+    while i != -1:
+        yield i
+        i = bits.find("1", i + 1)
+
+
+def split_beams(active_columns: int, splitters_hit: int) -> int:
+    return (active_columns & ~splitters_hit) | (splitters_hit << 1) | (splitters_hit >> 1)
+
+
+def propagate_layers(start_x: int, layers: Iterable[int]) -> int:
+    active_columns = 1 << start_x
     total_splits = 0
     for layer in layers:
         splitters_hit = layer & active_columns
-        total_splits += len(splitters_hit)
-        active_columns -= splitters_hit
-        active_columns |= set.union(*[{x-1, x+1} for x in splitters_hit])
+        total_splits += splitters_hit.bit_count()
+        active_columns = split_beams(active_columns, splitters_hit)
     return total_splits
 
-def quantum_layers(start_x: int, layers: list[set[int]]) -> int:
-    timelines = defaultdict(int, {start_x: 1})
+
+def quantum_layers(start_x: int, layers: Iterable[int]) -> int:
+    # The mask says which columns have any timelines, and the counts themselves live in a flat list by column, which
+    # grows as beams spread out to the right.  The list is shifted over by one so a beam split off the left edge still
+    # has a slot (column -1) to count in; the mask can drop it, since no splitter will ever be there to hit it.
+    active_columns = 1 << start_x
+    timelines = [0] * (start_x + 3)
+    timelines[start_x + 1] = 1
     for layer in layers:
-        splitters_hit = layer & set(timelines.keys())
-        for splitter in splitters_hit:
-            magnitude_at_splitter = timelines.pop(splitter)
-            timelines[splitter-1] += magnitude_at_splitter
-            timelines[splitter+1] += magnitude_at_splitter
-    return sum(timelines.values())
+        splitters_hit = layer & active_columns
+        if len(timelines) < splitters_hit.bit_length() + 2:
+            timelines.extend([0] * (splitters_hit.bit_length() + 2 - len(timelines)))
+        # Take every split beam off before spreading any of them, so side by side splitters can't feed each other
+        split = [(splitter + 1, timelines[splitter + 1]) for splitter in set_bits(splitters_hit)]
+        for slot, _ in split:
+            timelines[slot] = 0
+        for slot, magnitude_at_splitter in split:
+            timelines[slot - 1] += magnitude_at_splitter
+            timelines[slot + 1] += magnitude_at_splitter
+        active_columns = split_beams(active_columns, splitters_hit)
+    return sum(timelines)
+
+
+def parse() -> tuple[int, InputStream[int]]:
+    lines = stream_lines()
+    start_x = next(iter(lines)).index("S")
+    # Empty layers don't do anything, so they get filtered out
+    layers = InputStream(lambda: (mask for line in islice(lines, 1, None) if (mask := layer_mask(line))))
+    return start_x, layers
+
+
+def part_one(parsed: tuple[int, Iterable[int]]) -> int:
+    return propagate_layers(*parsed)
+
+
+def part_two(parsed: tuple[int, Iterable[int]]) -> int:
+    return quantum_layers(*parsed)
 
 
 def main():
-    start_x, layers = read_grid(read_data())
-    print(f"Part one: {propagate_layers(start_x, layers)}")
-    print(f"Part two: {quantum_layers(start_x, layers)}")
+    parsed = parse()
+    print(f"Part one: {part_one(parsed)}")
+    print(f"Part two: {part_two(parsed)}")
 
 
 if __name__ == "__main__":
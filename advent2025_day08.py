@@ -1,43 +1,170 @@
+import heapq
 import time
-from itertools import combinations
+from itertools import product
 from math import prod, sqrt
-from typing import Self
+from typing import Iterator, Self
 
 from utils import BaseCoord3D, read_data
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Coord(BaseCoord3D):
     def straight_dist(self, other: Self) -> float:
         dx, dy, dz = self.x - other.x, self.y - other.y, self.z - other.z
         return sqrt(dx**2 + dy**2 + dz**2)
 
+    def squared_dist(self, other: Self) -> int:
+        return (self.x - other.x) ** 2 + (self.y - other.y) ** 2 + (self.z - other.z) ** 2
+
     @classmethod
     def from_raw(cls, raw: str) -> Self:
         x, y, z = (int(x) for x in raw.split(","))
         return cls(x=x, y=y, z=z)
 
 
-def connect_circuits(points: set[Coord]) -> tuple[int, int]:
-    circuits: set[frozenset[Coord]] = set()
+class Circuits:
+    # Disjoint sets over point indexes, with union by size and path compression
+    def __init__(self, size: int):
+        self.parents = list(range(size))
+        self.sizes = [1] * size
+        self.count = size
+
+    def find(self, x: int) -> int:
+        parents = self.parents
+        while parents[x] != x:
+            # Path halving: point every other node at its grandparent on the way up
+            parents[x] = parents[parents[x]]
+            x = parents[x]
+        return x
+
+    def union(self, first: int, second: int) -> bool:
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return False
+        if self.sizes[first] < self.sizes[second]:
+            first, second = second, first
+        self.parents[second] = first
+        self.sizes[first] += self.sizes[second]
+        self.count -= 1
+        return True
+
+    def largest(self, n: int) -> list[int]:
+        return heapq.nlargest(n, (self.sizes[x] for x, parent in enumerate(self.parents) if x == parent))
+
+
+# Only half the neighboring cells get checked from each cell, so every pair of cells is only looked at once
+HALF_NEIGHBORS = [x for x in product((-1, 0, 1), repeat=3) if x > (0, 0, 0)]
+
+
+def pairs_within(points: list[Coord], radius: int) -> list[tuple[int, int, int]]:
+    # (squared distance, i, j) for every pair with i < j that's no further apart than radius, by bucketing the points
+    # into cells one radius wide so only neighboring cells need checking
+    cells: dict[tuple[int, int, int], list[int]] = {}
+    for i, point in enumerate(points):
+        cells.setdefault((point.x // radius, point.y // radius, point.z // radius), []).append(i)
+    limit = radius**2
+    pairs = []
+    for (cx, cy, cz), members in cells.items():
+        for n, i in enumerate(members):
+            for j in members[n + 1 :]:
+                if (dist := points[i].squared_dist(points[j])) <= limit:
+                    pairs.append((dist, i, j))
+        for dx, dy, dz in HALF_NEIGHBORS:
+            for j in cells.get((cx + dx, cy + dy, cz + dz), ()):
+                for i in members:
+                    if (dist := points[i].squared_dist(points[j])) <= limit:
+                        pairs.append((dist, min(i, j), max(i, j)))
+    return pairs
+
+
+def closest_pairs(points: list[Coord]) -> Iterator[tuple[int, int]]:
+    # Index pairs (i < j) in order of distance, generated lazily: each round finds the pairs within a radius, yields the
+    # ones beyond the last round's radius, and doubles it.  Ties come out in the same order as sorting combinations.
+    if len(points) < 2:
+        return
+    span = max(max(getattr(p, axis) for p in points) - min(getattr(p, axis) for p in points) for axis in "xyz")
+    # Start at about the radius where there are as many pairs as points, if they're spread evenly
+    radius = max(span // max(round(len(points) ** (1 / 3)), 1) // 2, 1)
+    covered = -1
+    while covered < 3 * span**2:
+        band = sorted(x for x in pairs_within(points, radius) if x[0] > covered)
+        yield from ((i, j) for _, i, j in band)
+        covered = radius**2
+        radius *= 2
+
+
+def connect_circuits(points: list[Coord], stop_after_p1: bool = False) -> tuple[int, int]:
+    circuits = Circuits(len(points))
     p1_answer = -1
-    for i, (first, second) in enumerate(sorted(combinations(points, 2), key=lambda x: x[0].straight_dist(x[1]))):
+    for i, (first, second) in enumerate(closest_pairs(points)):
         if i == 1000:
-            p1_answer = prod(sorted((len(x) for x in circuits), reverse=True)[:3])
-        first_circuit = next(iter(x for x in circuits if first in x), frozenset())
-        second_circuit = next(iter(x for x in circuits if second in x), frozenset())
-        circuits.discard(first_circuit)
-        circuits.discard(second_circuit)
-        circuits.add(frozenset({first, second}) | first_circuit | second_circuit)
-        if len(circuits) == 1 and len(next(iter(circuits))) == len(points):
-            return p1_answer, first.x * second.x
+            p1_answer = prod(circuits.largest(3))
+            if stop_after_p1:
+                return p1_answer, -1
+        circuits.union(first, second)
+        if circuits.count == 1:
+            return p1_answer, points[first].x * points[second].x
     return p1_answer, -1
 
 
+def spanning_tree(points: list[Coord]) -> list[tuple[int, int]]:
+    # Prim's algorithm over the complete graph, giving the minimum spanning tree's edges in the order they join it.
+    # Only the closest tree point to each point outside the tree is kept, so memory stays O(n), and each step is one
+    # vectorized pass over the points still outside.  Equal distances are broken by (lower index, higher index), same
+    # as closest_pairs, which makes the tree exactly the one connect_circuits builds.
+    xs, ys, zs = (np.array([getattr(p, axis) for p in points], dtype=np.int64) for axis in "xyz")
+    outside = np.arange(1, len(points))
+    closest = np.full(len(outside), np.iinfo(np.int64).max, dtype=np.int64)
+    closest_to = np.zeros(len(outside), dtype=np.int64)
+    edges = []
+    latest = 0
+    while len(outside):
+        x, y, z = xs[outside], ys[outside], zs[outside]
+        dists = (x - xs[latest]) ** 2 + (y - ys[latest]) ** 2 + (z - zs[latest]) ** 2
+        # For a given outside point, the lower tree point always makes the lower index pair
+        closer = (dists < closest) | ((dists == closest) & (latest < closest_to))
+        closest[closer] = dists[closer]
+        closest_to[closer] = latest
+        tied = np.flatnonzero(closest == closest.min()).tolist()
+        pairs = zip(closest_to[tied].tolist(), outside[tied].tolist())
+        _, _, nearest = min((min(a, b), max(a, b), i) for i, (a, b) in zip(tied, pairs))
+        latest = int(outside[nearest])
+        edges.append((int(closest_to[nearest]), latest))
+        # Drop the new tree point by moving the last one into its place
+        for column in (outside, closest, closest_to):
+            column[nearest] = column[-1]
+        outside, closest, closest_to = outside[:-1], closest[:-1], closest_to[:-1]
+    return edges
+
+
+def parse() -> list[Coord]:
+    return [Coord.from_raw(x) for x in read_data().splitlines()]
+
+
+def part_one(points: list[Coord]) -> int:
+    return connect_circuits(points, stop_after_p1=True)[0]
+
+
+def part_two(points: list[Coord]) -> int:
+    if np is not None:
+        # The pair that finally joins everything up is the longest edge of the minimum spanning tree, ties broken the
+        # same way closest_pairs orders them, so the answer doesn't depend on whether numpy is around
+        edges = [(points[i].squared_dist(points[j]), min(i, j), max(i, j)) for i, j in spanning_tree(points)]
+        if not edges:
+            return -1
+        _, first, second = max(edges)
+        return points[first].x * points[second].x
+    return connect_circuits(points)[1]
+
+
 def main():
-    points = {Coord.from_raw(x) for x in read_data().splitlines()}
-    p1, p2 = connect_circuits(points)
-    print(f"Part one: {p1}")
-    print(f"Part two: {p2}")
+    points = parse()
+    print(f"Part one: {part_one(points)}")
+    print(f"Part two: {part_two(points)}")
 
 
 if __name__ == "__main__":
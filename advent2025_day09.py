@@ -1,8 +1,17 @@
 import time
-from itertools import combinations, pairwise
-from typing import Iterable, Self
+from array import array
+from itertools import accumulate, batched, pairwise
+from operator import add
+from typing import Callable, Iterable, Self, Sequence
 
-from utils import BaseCoord, read_data
+from utils import BaseCoord, Grid, read_data
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+OUTSIDE, GREEN = 0, 1
 
 
 class Coord(BaseCoord):
@@ -11,113 +20,213 @@ class Coord(BaseCoord):
         x, y = raw.split(",")
         return cls(x=int(x), y=int(y))
 
-    def x_range(self, other: Self) -> range:
-        return range(min(self.x, other.x), max(self.x, other.x) + 1)
-
-    def y_range(self, other: Self) -> range:
-        return range(min(self.y, other.y), max(self.y, other.y) + 1)
-
     def area(self, other: Self) -> int:
         # The +1s are because the area includes the points themselves
         dx, dy = abs(self.x - other.x) + 1, abs(self.y - other.y) + 1
         return dx * dy
 
-    def line_intersects(self, other: Self, point1: Self, point2: Self) -> bool:
-        is_right = min(point1.x, point2.x) >= max(self.x, other.x)
-        is_left = max(point1.x, point2.x) <= min(self.x, other.x)
-        is_below = min(point1.y, point2.y) >= max(self.y, other.y)
-        is_above = max(point1.y, point2.y) <= min(self.y, other.y)
-        if all(x is False for x in (is_right, is_left, is_below, is_above)):
-            return True
-        return False
 
-    def points_in_area(self, other: Self) -> Iterable[Self]:
-        for y in self.y_range(other):
-            for x in self.x_range(other):
-                yield Coord(x=x, y=y)
+class PairAreas:
+    # Areas of the rectangles between an anchor point and every point after it, worked out one anchor at a time so
+    # nothing ever holds all n^2 / 2 of them
+    def __init__(self, points: list[Coord]):
+        self.points = points
+        self.xs, self.ys = [x.x for x in points], [x.y for x in points]
+        if np is not None:
+            self.xs, self.ys = np.array(self.xs, dtype=np.int64), np.array(self.ys, dtype=np.int64)
+
+    def __call__(self, anchor: int) -> Sequence[int]:
+        x, y = self.xs[anchor], self.ys[anchor]
+        if np is not None:
+            return (np.abs(self.xs[anchor + 1 :] - x) + 1) * (np.abs(self.ys[anchor + 1 :] - y) + 1)
+        return [(abs(x - ox) + 1) * (abs(y - oy) + 1) for ox, oy in zip(self.xs[anchor + 1 :], self.ys[anchor + 1 :])]
+
+    def ranked(self, anchor: int, above: int = 0) -> list[int]:
+        # Indexes of the anchor's partners making an area over `above`, biggest first
+        areas = self(anchor)
+        if np is not None:
+            (candidates,) = np.nonzero(areas > above)
+            return (candidates[np.argsort(-areas[candidates], kind="stable")] + anchor + 1).tolist()
+        candidates = sorted((-x, i) for i, x in enumerate(areas) if x > above)
+        return [i + anchor + 1 for _, i in candidates]
+
+
+def largest_rectangle(points: list[Coord], first_valid: Callable[[int, list[int]], int | None]) -> int:
+    # Branch and bound over anchor points, best possible area first.  Each anchor only ranks the partners that would
+    # beat the best rectangle so far and hands them to first_valid, which returns the first one that works (if any).
+    # Once no anchor can possibly beat the best, the search is done.
+    pair_areas = PairAreas(points)
+    bounds = sorted(((int(max(pair_areas(i))), i) for i in range(len(points) - 1)), reverse=True)
+    best = 0
+    for bound, anchor in bounds:
+        if bound <= best:
+            break
+        partner = first_valid(anchor, pair_areas.ranked(anchor, above=best))
+        if partner is not None:
+            best = points[anchor].area(points[partner])
+    return best
+
+
+def staircases(points: list[tuple[int, int]]) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    # The lower-left and upper-right Pareto frontiers: the points with nothing both left of and below them (or right of
+    # and above them).  Both come out sorted by x going up, which makes y go down.
+    lower, upper = [], []
+    for point in sorted(points):
+        if not lower or point[1] < lower[-1][1]:
+            lower.append(point)
+    for point in sorted(points, reverse=True):
+        if not upper or point[1] > upper[-1][1]:
+            upper.append(point)
+    return lower, upper[::-1]
+
+
+def best_across(lower: list[tuple[int, int]], upper: list[tuple[int, int]]) -> int:
+    # Biggest rectangle with its bottom left corner on the lower staircase and its top right on the upper one.  Moving
+    # along the lower staircase never moves the best partner backwards along the upper one, so divide and conquer
+    # only has to search a shrinking window of partners for each point.
+    best = 0
+    to_search = [(0, len(lower), 0, len(upper))]
+    while to_search:
+        start, stop, partner_start, partner_stop = to_search.pop()
+        if start >= stop:
+            continue
+        mid = (start + stop) // 2
+        x, y = lower[mid]
+        window = enumerate(upper[partner_start:partner_stop], partner_start)
+        area, partner = max(((ox - x + 1) * (oy - y + 1), i) for i, (ox, oy) in window)
+        best = max(best, area)
+        to_search += [(start, mid, partner_start, partner + 1), (mid + 1, stop, partner, partner_stop)]
+    return best
+
+
+def largest_area(points: list[Coord]) -> int:
+    # The biggest rectangle can always be stretched out until its corners sit on opposite staircases, either bottom
+    # left to top right, or (with y flipped) top left to bottom right.  Near O(n log n) instead of trying every pair.
+    best = 0
+    for flip in (1, -1):
+        best = max(best, best_across(*staircases([(p.x, flip * p.y) for p in points])))
+    return best
+
+
+def compress_axis(values: Iterable[int]) -> dict[int, int]:
+    # Neighboring coordinates get neighboring indexes, with an extra index left between them to stand for all the
+    # tiles in the gap, but only when there are tiles there, so a gap between two edges never disappears and a gap
+    # that doesn't exist never shows up
+    mapping: dict[int, int] = {}
+    index, previous = 0, None
+    for value in sorted(set(values)):
+        if previous is not None:
+            index += 1 if value == previous + 1 else 2
+        mapping[value], previous = index, value
+    return mapping
+
+
+def compress_points(points: list[Coord]) -> list[Coord]:
+    x_mapping = compress_axis(point.x for point in points)
+    y_mapping = compress_axis(point.y for point in points)
+    return [Coord(x=x_mapping[point.x], y=y_mapping[point.y]) for point in points]
+
+
+def draw_line(grid: Grid, first: Coord, second: Coord):
+    if first.x != second.x and first.y != second.y:
+        raise Exception("Points not in a straight line!")
+    start = grid.index(min(first.x, second.x), min(first.y, second.y))
+    stop = grid.index(max(first.x, second.x), max(first.y, second.y))
+    # Slice-assign whole lines at once; vertical lines are just a slice that steps a full row at a time
+    step = 1 if first.y == second.y else grid.stride
+    grid.cells[start : stop + 1 : step] = bytes([GREEN]) * ((stop - start) // step + 1)
+
+
+def get_green_tiles(points: list[Coord]) -> Grid:
+    green_tiles = Grid(max(x.x for x in points) + 1, max(x.y for x in points) + 1, fill=OUTSIDE)
+    # Set up a sliding window, going through the points by pairs after advancing one of the iterators by one
+    for first, second in pairwise(points + [points[0]]):
+        draw_line(green_tiles, first, second)
+    # Scanline fill of the inside.  Between each pair of neighboring corner rows there's a line no corner sits on
+    # (through the gap row if there is one), and along it the inside is just between pairs of vertical edges crossing
+    # it.  A tile on a corner row that isn't on the boundary has the same inside-ness as the lines either side of it,
+    # so each line's spans get filled into the rows on both sides of it too.
+    edges = pairwise(points + [points[0]])
+    vertical_edges = sorted((min(a.y, b.y), max(a.y, b.y), a.x) for a, b in edges if a.x == b.x)
+    active: list[tuple[int, int]] = []
+    next_edge = 0
+    cells, green_row = green_tiles.cells, bytes([GREEN]) * green_tiles.width
+    for above, below in pairwise(sorted({point.y for point in points})):
+        while next_edge < len(vertical_edges) and vertical_edges[next_edge][0] <= above:
+            _, bottom, x = vertical_edges[next_edge]
+            active.append((x, bottom))
+            next_edge += 1
+        active = sorted(edge for edge in active if edge[1] >= below)
+        for (left, _), (right, _) in batched(active, 2):
+            for row in range(above, below + 1):
+                cells[green_tiles.index(left, row) : green_tiles.index(right, row) + 1] = green_row[: right - left + 1]
+    return green_tiles
+
 
-    def line_between(self, other: Self) -> Iterable[Self]:
-        if self.x == other.x:
-            yield from (Coord(x=self.x, y=y) for y in self.y_range(other))
-        elif self.y == other.y:
-            yield from (Coord(x=x, y=self.y) for x in self.x_range(other))
-        else:
-            raise Exception("Points not in a straight line!")
+def outside_table(green_tiles: Grid):
+    # Summed-area table of the outside tiles: entry [y][x] counts the ones above and left of (x, y), so any
+    # rectangle's count is four lookups
+    if np is not None:
+        outside = green_tiles.as_array()[1:-1, 1:-1] == OUTSIDE
+        dtype = np.int32 if outside.size < 2**31 else np.int64
+        table = np.zeros((green_tiles.height + 1, green_tiles.width + 1), dtype=dtype)
+        table[1:, 1:] = outside.cumsum(axis=0, dtype=dtype).cumsum(axis=1, dtype=dtype)
+        return table
+    # Without numpy, each row is an array("q") so the table costs 8 bytes an entry rather than a list of boxed ints
+    table = [array("q", bytes(8 * (green_tiles.width + 1)))]
+    for y in range(green_tiles.height):
+        row = accumulate((x == OUTSIDE for x in green_tiles.cells[green_tiles.row(y)]), initial=0)
+        table.append(array("q", map(add, table[-1], row)))
+    return table
 
 
-def get_lines(points: list[Coord]) -> list[tuple[Coord, Coord]]:
-    return sorted(pairwise(points + [points[0]]), key=lambda x: x[0].distance(x[1]), reverse=True)
+def check_combo_table(first: Coord, second: Coord, table) -> bool:
+    min_x, max_x = min(first.x, second.x), max(first.x, second.x) + 1
+    min_y, max_y = min(first.y, second.y), max(first.y, second.y) + 1
+    return table[max_y][max_x] - table[min_y][max_x] - table[max_y][min_x] + table[min_y][min_x] == 0
 
 
-def check_combo_lines(area_one: Coord, area_two: Coord, lines: list[tuple[Coord, Coord]]) -> bool:
-    for line_one, line_two in lines:
-        if area_one.line_intersects(area_two, line_one, line_two):
-            return False
-    return True
+def solve_p2_compression(points: list[Coord]) -> int:
+    compressed_points = compress_points(points)
+    table = outside_table(get_green_tiles(compressed_points))
+    # Candidates go by their real area, since compressing doesn't keep the order of areas
+    if np is None:
 
+        def first_valid(anchor: int, partners: list[int]) -> int | None:
+            first = compressed_points[anchor]
+            return next((x for x in partners if check_combo_table(first, compressed_points[x], table)), None)
 
-def compress_points(points: list[Coord]) -> tuple[dict[int, int], dict[int, int], list[Coord]]:
-    x_mapping = {x: i for i, x in enumerate(sorted({point.x for point in points}))}
-    y_mapping = {x: i for i, x in enumerate(sorted({point.y for point in points}))}
-    new_points = [Coord(x=x_mapping[point.x], y=y_mapping[point.y]) for point in points]
-    return {v: k for k, v in x_mapping.items()}, {v: k for k, v in y_mapping.items()}, new_points
+    else:
+        xs, ys = (np.array([getattr(p, axis) for p in compressed_points], dtype=np.int64) for axis in "xy")
 
+        def first_valid(anchor: int, partners: list[int]) -> int | None:
+            # Look up every partner's rectangle in the table at once
+            others = np.array(partners, dtype=np.int64)
+            min_x, max_x = np.minimum(xs[others], xs[anchor]), np.maximum(xs[others], xs[anchor]) + 1
+            min_y, max_y = np.minimum(ys[others], ys[anchor]), np.maximum(ys[others], ys[anchor]) + 1
+            outside = table[max_y, max_x] - table[min_y, max_x] - table[max_y, min_x] + table[min_y, min_x]
+            valid = np.flatnonzero(outside == 0)
+            return partners[valid[0]] if len(valid) else None
 
-def get_green_tiles(points: list[Coord]) -> set[Coord]:
-    green_tiles: set[Coord] = set()
-    # Set up a sliding window, going through the points by pairs after advancing one of the iterators by one
-    for first, second in pairwise(points + [points[0]]):
-        green_tiles.update(first.line_between(second))
-    # Now that we have the boundary, do a flood fill of the inside
-    # First, find a pixel with the leftmost x
-    pixel = next(iter(x for x in sorted(points, key=lambda x: x.x)))
-    # Then, go right until you see an empty spot.  That spot will be inside.
-    while pixel in green_tiles:
-        pixel += Coord(x=1, y=0)
-    # Now that we have an inner pixel, flood fill
-    to_fill = [pixel]
-    while to_fill:
-        cur = to_fill.pop()
-        for neighbor in cur.cardinal_neighbors():
-            if neighbor not in green_tiles:
-                to_fill.append(neighbor)
-                green_tiles.add(neighbor)
-    return green_tiles
+    return largest_rectangle(points, first_valid)
 
 
-def check_combo_greentiles(first: Coord, second: Coord, green_tiles: set[Coord]) -> bool:
-    return all(x in green_tiles for x in first.points_in_area(second))
+def parse() -> list[Coord]:
+    return [Coord.from_str(line) for line in read_data().splitlines()]
 
 
-def solve_p2_compression(points: list[Coord]) -> int:
-    x_map, y_map, compressed_points = compress_points(points)
-    biggest_rectangles = sorted(combinations(compressed_points, r=2), key=lambda x: x[0].area(x[1]), reverse=True)
-    green_tiles = get_green_tiles(compressed_points)
-    first, second = None, None
-    for first, second in biggest_rectangles:
-        if check_combo_greentiles(first, second, green_tiles):
-            break
-    # Once we have our max points, we re-expand them so we can get the actual area
-    real_first, real_second = Coord(x=x_map[first.x], y=y_map[first.y]), Coord(x=x_map[second.x], y=y_map[second.y])
-    return real_first.area(real_second)
+def part_one(points: list[Coord]) -> int:
+    return largest_area(points)
 
 
-def solve_p2_lines(points: list[Coord], biggest_rectangles: list[tuple[Coord, Coord]]) -> int:
-    lines = get_lines(points)
-    biggest_rectangles = sorted(combinations(points, r=2), key=lambda x: x[0].area(x[1]), reverse=True)
-    first, second = None, None
-    for first, second in biggest_rectangles:
-        if check_combo_lines(first, second, lines):
-            break
-    return first.area(second)
+def part_two(points: list[Coord]) -> int:
+    return solve_p2_compression(points)
 
 
 def main():
-    points: list[Coord] = [Coord.from_str(line) for line in read_data().splitlines()]
-    biggest_rectangles = sorted(combinations(points, r=2), key=lambda x: x[0].area(x[1]), reverse=True)
-    max_area = biggest_rectangles[0][0].area(biggest_rectangles[0][1])
-    print(f"Part one: {max_area}")
-    print(f"Part two: {solve_p2_lines(points, biggest_rectangles)}")
+    points = parse()
+    print(f"Part one: {part_one(points)}")
+    print(f"Part two: {part_two(points)}")
 
 
 if __name__ == "__main__":
@@ -1,12 +1,88 @@
 import time
-from collections import defaultdict
-from functools import cache, reduce
-from itertools import combinations, chain
+from collections import OrderedDict
 from math import inf
-from operator import xor
-from typing import NamedTuple, Self
-
-from utils import read_data
+from typing import Iterable, Iterator, NamedTuple, Self
+
+from utils import cached_parse, count, parallel_map, phase, stream_lines
+
+
+class ButtonSpace:
+    # The buttons as vectors over GF(2), with one light per bit.  Gaussian elimination gives a basis (keyed by each
+    # vector's top bit, and remembering which buttons XOR together to make it) plus the nullspace: combos of buttons
+    # that cancel out completely.  Every combo making a pattern is then one particular solution XOR any nullspace
+    # combo, so patterns get worked out as they're asked for instead of trying all 2^buttons combos up front.
+    # Combos are bitmasks of button indexes.
+    def __init__(self, buttons: tuple[int, ...]):
+        self.buttons = buttons
+        self.basis: dict[int, tuple[int, int]] = {}
+        self.nullspace: list[int] = []
+        self.combos: dict[int, list[tuple[int, ...]]] = {}
+        for i, vector in enumerate(buttons):
+            combo = 1 << i
+            while vector:
+                top = vector.bit_length() - 1
+                if top not in self.basis:
+                    self.basis[top] = (vector, combo)
+                    break
+                vector, combo = vector ^ self.basis[top][0], combo ^ self.basis[top][1]
+            else:
+                self.nullspace.append(combo)
+
+    def particular(self, pattern: int) -> int | None:
+        # One combo of buttons making the pattern, or None if no combo can
+        combo = 0
+        while pattern:
+            top = pattern.bit_length() - 1
+            if top not in self.basis:
+                return None
+            pattern, combo = pattern ^ self.basis[top][0], combo ^ self.basis[top][1]
+        return combo
+
+    def solutions(self, pattern: int) -> Iterator[int]:
+        if (combo := self.particular(pattern)) is None:
+            return
+        yield combo
+        # Gray code order, so each step is a single XOR
+        for i in range(1, 1 << len(self.nullspace)):
+            combo ^= self.nullspace[(i & -i).bit_length() - 1]
+            yield combo
+
+    def __getitem__(self, pattern: int) -> list[tuple[int, ...]]:
+        # Every combo of buttons making the pattern, as button indexes, fewest buttons first
+        if pattern not in self.combos:
+            combos = sorted(self.solutions(pattern), key=int.bit_count)
+            self.combos[pattern] = [tuple(i for i in range(len(self.buttons)) if x >> i & 1) for x in combos]
+        return self.combos[pattern]
+
+    def min_presses(self, pattern: int) -> int | None:
+        # Fewest buttons making the pattern.  With a small nullspace that's a walk over its span, otherwise meet in the
+        # middle: every XOR of the first half of the buttons (with its fewest presses), looked up from the second half.
+        if len(self.nullspace) <= len(self.buttons) // 2:
+            return min((x.bit_count() for x in self.solutions(pattern)), default=None)
+        half = len(self.buttons) // 2
+        first_half: dict[int, int] = {}
+        for result, presses in self._subset_xors(self.buttons[:half]):
+            first_half[result] = min(first_half.get(result, presses), presses)
+        best = inf
+        for result, presses in self._subset_xors(self.buttons[half:]):
+            if (pattern ^ result) in first_half:
+                best = min(best, presses + first_half[pattern ^ result])
+        return None if best == inf else best
+
+    @staticmethod
+    def _subset_xors(buttons: tuple[int, ...]) -> Iterator[tuple[int, int]]:
+        # (XOR, number of buttons) for every subset of the buttons, again in Gray code order
+        result, subset = 0, 0
+        yield result, 0
+        for i in range(1, 1 << len(buttons)):
+            bit = (i & -i).bit_length() - 1
+            result, subset = result ^ buttons[bit], subset ^ (1 << bit)
+            yield result, subset.bit_count()
+
+
+# Most joltage targets one machine's memo holds at once, or None for no limit.  The memo only lives as long as the
+# machine is being solved either way.
+JOLTAGE_CACHE_SIZE: int | None = None
 
 
 class Machine(NamedTuple):
@@ -28,37 +104,59 @@ class Machine(NamedTuple):
         return len(self.raw_desired)
 
     @property
-    @cache
     def buttons(self) -> tuple[int, ...]:
         return tuple(int("".join("1" if x else "0" for x in button), 2) for button in self.raw_buttons)
 
     @property
-    @cache
     def desired(self) -> int:
         return int(f"{''.join('1' if x else '0' for x in self.raw_desired)}", 2)
 
-    @property
-    @cache
-    def patterns(self):
-        patterns: dict[int, list[tuple[int, ...]]] = defaultdict(list)
-        for pat_length in range(0, len(self.buttons) + 1):
-            for combo in combinations(range(len(self.buttons)), r=pat_length):
-                result = reduce(xor, chain([0], (self.buttons[x] for x in combo)))
-                patterns[result].append(combo)
-        return patterns
-
-    @cache
-    def buttons_joltage(self, buttons: tuple[int, ...]) -> tuple[int, ...]:
-        return tuple(sum(x) for x in zip((0,) * self.num_lights, *(self.raw_buttons[i] for i in buttons)))
+    @phase("day10.patterns")
+    def calc_patterns(self) -> ButtonSpace:
+        # Nothing keeps hold of this outside of whoever asked for it, so no machine's patterns outlive its solving
+        return ButtonSpace(self.buttons)
+
+    def start(self) -> int:
+        return self.calc_patterns().min_presses(self.desired)
+
+    def set_joltages(self) -> int:
+        return JoltageSolver(self, JOLTAGE_CACHE_SIZE).solve()
+
+    def __repr__(self) -> str:
+        desired = f"{''.join('#' if x else '.' for x in self.raw_desired)}"
+        buttons = " ".join(f"({','.join(str(i) for i, v in enumerate(x) if v)})" for x in self.raw_buttons)
+        joltages = ",".join(str(x) for x in self.joltages)
+        return f"[{desired}] {buttons} {{{joltages}}}"
+
 
-    def start(self):
-        return min(len(x) for x in self.patterns[self.desired])
+class JoltageSolver:
+    # Works out the fewest presses to hit one machine's joltages, holding its own memo tables (and parity patterns) so
+    # they get freed as soon as the machine is done, rather than piling up in a global cache across every machine.
+    def __init__(self, machine: Machine, cache_size: int | None = None):
+        self.machine = machine
+        self.cache_size = cache_size
+        self.patterns = machine.calc_patterns()
+        self.memo: OrderedDict[tuple[int, ...], int | float] = OrderedDict()
+        self.button_joltages: dict[tuple[int, ...], tuple[int, ...]] = {}
 
-    @cache
-    def calc_joltage_step(self, target: tuple[int, ...]) -> int | None:
+    def buttons_joltage(self, buttons: tuple[int, ...]) -> tuple[int, ...]:
+        if buttons not in self.button_joltages:
+            raw_buttons = self.machine.raw_buttons
+            self.button_joltages[buttons] = tuple(
+                sum(x) for x in zip((0,) * self.machine.num_lights, *(raw_buttons[i] for i in buttons))
+            )
+        return self.button_joltages[buttons]
+
+    def calc_joltage_step(self, target: tuple[int, ...]) -> int | float:
         # If our target is all zeroes, we're done, return 0
         if not any(target):
             return 0
+        if target in self.memo:
+            count("day10.joltage_memo_hits")
+            if self.cache_size is not None:
+                self.memo.move_to_end(target)
+            return self.memo[target]
+        count("day10.joltage_memo_misses")
         # The final pattern is equal to the parity of the joltage
         target_pattern = int("".join("1" if x % 2 else "0" for x in target), 2)
         # For each possible combination of buttons to hit the target pattern, calculate the joltage from pushing them
@@ -66,28 +164,45 @@ class Machine(NamedTuple):
         for combo in self.patterns[target_pattern]:
             buttons_joltage = self.buttons_joltage(combo)
             # If this is a valid combo, subtracting it from target will result in no negative numbers
-            after_joltage = [x[0] - x[1] for x in zip(target, buttons_joltage)]
-            if any(x < 0 for x in after_joltage):
+            if any(x < y for x, y in zip(target, buttons_joltage)):
+                count("day10.overshooting_combos")
+                continue
+            # At this point all the target levels should be even, so we can divide them by half
+            half_target = tuple((x - y) // 2 for x, y in zip(target, buttons_joltage))
+            # Each press bumps a light by at most one, so the half target needs at least max(half_target) presses.  If
+            # even that can't beat the best so far, there's no point recursing.
+            if len(combo) + 2 * max(half_target) >= min_presses:
+                count("day10.pruned_combos")
                 continue
-            # At this point all the target levels should be even, so we can divide them by half and recurse
-            half_joltage_presses = self.calc_joltage_step(tuple(x // 2 for x in after_joltage))
-            min_presses = min(min_presses, len(combo) + (2 * half_joltage_presses))
+            min_presses = min(min_presses, len(combo) + (2 * self.calc_joltage_step(half_target)))
+        self.memo[target] = min_presses
+        if self.cache_size is not None and len(self.memo) > self.cache_size:
+            self.memo.popitem(last=False)
         return min_presses
 
-    def set_joltages(self) -> int:
-        return self.calc_joltage_step(self.joltages)
+    def solve(self) -> int:
+        return self.calc_joltage_step(self.machine.joltages)
 
-    def __repr__(self) -> str:
-        desired = f"{''.join('#' if x else '.' for x in self.raw_desired)}"
-        buttons = " ".join(f"({','.join(str(i) for i, v in enumerate(x) if v)})" for x in self.raw_buttons)
-        joltages = ",".join(str(x) for x in self.joltages)
-        return f"[{desired}] {buttons} {{{joltages}}}"
+
+# Patterns are cheap enough to work out on demand now, so only the machines themselves go in the parse cache
+@cached_parse
+def parse() -> list[Machine]:
+    return [Machine.from_line(x) for x in stream_lines()]
+
+
+def part_one(machines: Iterable[Machine]) -> int:
+    return sum(x.start() for x in machines)
+
+
+def part_two(machines: Iterable[Machine]) -> int:
+    # Every machine is independent, so spread them across cores
+    return sum(parallel_map(Machine.set_joltages, machines, chunk_size=4))
 
 
 def main():
-    machines = [Machine.from_line(x) for x in read_data().splitlines()]
-    print(f"Part one: {sum(x.start() for x in machines)}")
-    print(f"Part two: {sum(x.set_joltages() for x in machines)}")
+    machines = parse()
+    print(f"Part one: {part_one(machines)}")
+    print(f"Part two: {part_two(machines)}")
 
 
 if __name__ == "__main__":
@@ -1,33 +1,102 @@
 import time
-from collections import defaultdict
-from functools import cache
+from collections import defaultdict, deque
+from typing import Iterable
 
-from utils import read_data
+from utils import cached_parse, count, stream_lines
 
 
-def build_connections(raw_input: str) -> dict[str, set[str]]:
+def build_connections(lines: Iterable[str]) -> dict[str, set[str]]:
     connections: dict[str, set[str]] = defaultdict(set)
-    for line in raw_input.splitlines():
+    for line in lines:
         name, *outputs = (x.replace(":", "") for x in line.split())
         connections[name] = set(outputs)
     return connections
 
 
+class PathCounter:
+    # The devices numbered in topological order, worked out once, so any number of path counting queries can each be
+    # one forward pass over the order, with no recursion however deep the graph goes
+    def __init__(self, connections: dict[str, set[str]]):
+        names = sorted(set(connections) | {x for outputs in connections.values() for x in outputs})
+        ids = {name: i for i, name in enumerate(names)}
+        outputs = [[ids[x] for x in connections.get(name, ())] for name in names]
+        # Kahn's algorithm
+        incoming = [0] * len(names)
+        for node_outputs in outputs:
+            for x in node_outputs:
+                incoming[x] += 1
+        ready = deque(i for i, x in enumerate(incoming) if x == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for x in outputs[node]:
+                incoming[x] -= 1
+                if incoming[x] == 0:
+                    ready.append(x)
+        if len(order) != len(names):
+            raise ValueError("Device connections have a loop, so the number of paths isn't finite")
+        # Renumber everything by position in the order, so every connection goes from a lower number to a higher one
+        position = {node: i for i, node in enumerate(order)}
+        self.ids = {name: position[i] for name, i in ids.items()}
+        self.outputs = [[position[x] for x in outputs[node]] for node in order]
+
+    def reaches(self, end: int) -> list[bool]:
+        # Which devices have any path to end, walking the order backwards
+        reaches = [False] * len(self.outputs)
+        reaches[end] = True
+        for node in range(end - 1, -1, -1):
+            reaches[node] = any(reaches[x] for x in self.outputs[node])
+        return reaches
+
+    def count_paths(self, start: str, end: str, must_include: Iterable[str] = ()) -> int:
+        if start not in self.ids or end not in self.ids:
+            return 0
+        start_id, end_id = self.ids[start], self.ids[end]
+        # Each waypoint gets a bit, and a path's state is the set of waypoints it's been through so far
+        waypoints = {self.ids[x]: 1 << i for i, x in enumerate(must_include) if x in self.ids}
+        if len(waypoints) < len(set(must_include)):
+            return 0
+        everything = (1 << len(waypoints)) - 1
+        reaches = self.reaches(end_id)
+        # Paths into each device so far, by waypoint state.  Devices only get added once something can get to them,
+        # and are dropped once passed, so only the part of the order between start and end is ever held.
+        paths: dict[int, dict[int, int]] = {start_id: {waypoints.get(start_id, 0): 1}}
+        for node in range(start_id, end_id):
+            if node not in paths:
+                continue
+            node_paths = paths.pop(node)
+            for x in self.outputs[node]:
+                if not reaches[x]:
+                    count("day11.pruned_edges")
+                    continue
+                next_paths = paths.setdefault(x, defaultdict(int))
+                for state, num_paths in node_paths.items():
+                    next_paths[state | waypoints.get(x, 0)] += num_paths
+        return paths.get(end_id, {}).get(everything, 0)
+
+
 def find_paths(nodes: dict[str, set[str]], path_start: str, path_end: str, must_include: set[str]) -> int:
-    @cache
-    def _find_paths(start: str, end: str, required_seen: frozenset[str]) -> int:
-        if start == end and required_seen == must_include:
-            return 1
-        if start in must_include:
-            required_seen |= {start}
-        return sum(_find_paths(x, end, required_seen) for x in nodes[start])
-    return _find_paths(path_start, path_end, frozenset())
+    return PathCounter(nodes).count_paths(path_start, path_end, must_include)
+
+
+@cached_parse
+def parse() -> PathCounter:
+    return PathCounter(build_connections(stream_lines()))
+
+
+def part_one(paths: PathCounter) -> int:
+    return paths.count_paths("you", "out")
+
+
+def part_two(paths: PathCounter) -> int:
+    return paths.count_paths("svr", "out", must_include={"dac", "fft"})
 
 
 def main():
-    connections = build_connections(read_data())
-    print(f"Part one: {find_paths(connections, "you", "out", must_include=set())}")
-    print(f"Part two: {find_paths(connections, "svr", "out", must_include={"dac", "fft"})}")
+    paths = parse()
+    print(f"Part one: {part_one(paths)}")
+    print(f"Part two: {part_two(paths)}")
 
 
 if __name__ == "__main__":
@@ -23,11 +23,20 @@ class Field(NamedTuple):
         return sum(prod(x) for x in zip(self.pattern_counts, pattern_sizes)) <= self.size_x * self.size_y
 
 
-def main():
+def parse() -> tuple[list[int], list[Field]]:
     *raw_patterns, raw_fields = read_data().split("\n\n")
     pattern_sizes = [Counter(x)["#"] for x in raw_patterns]
-    fields = [Field.from_line(x) for x in raw_fields.splitlines()]
-    print(f"Part one: {sum(x.hacky_is_valid(pattern_sizes) for x in fields)}")
+    return pattern_sizes, [Field.from_line(x) for x in raw_fields.splitlines()]
+
+
+def part_one(parsed: tuple[list[int], list[Field]]) -> int:
+    pattern_sizes, fields = parsed
+    return sum(x.hacky_is_valid(pattern_sizes) for x in fields)
+
+
+def main():
+    parsed = parse()
+    print(f"Part one: {part_one(parsed)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,165 @@
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from math import ceil
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from utils import day_modules, set_input_dir
+
+# Benchmarks every day module's parse(), part_one() and part_two() separately, writes the results out as JSON, and
+# optionally compares them against a saved baseline, e.g.:
+#   python benchmark.py --save-baseline          (before a change)
+#   python benchmark.py --baseline               (after it, exits non-zero if anything got slower)
+
+DEFAULT_OUTPUT = Path(__file__).parent / "benchmark_results.json"
+DEFAULT_BASELINE = Path(__file__).parent / "benchmark_baseline.json"
+PHASES = ("parse", "part_one", "part_two")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    # Nearest-rank percentile, which is plenty for the handful of samples we take
+    ordered = sorted(samples)
+    return ordered[max(ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def clear_caches(module: ModuleType):
+    # Any functools cache on a day's functions or methods would otherwise turn every run after the first into a lookup
+    candidates = list(vars(module).values())
+    candidates += [y for x in candidates if isinstance(x, type) for y in vars(x).values()]
+    for candidate in candidates:
+        candidate = candidate.fget if isinstance(candidate, property) else candidate
+        if hasattr(candidate, "cache_clear"):
+            candidate.cache_clear()
+
+
+def phase_runner(module: ModuleType, phase: str) -> tuple[Callable[[], Any], Callable[[Any], Any]]:
+    # Returns (setup, timed) for a phase.  The parts get a freshly parsed input every run, since some of them
+    # (like day04) consume their input as they go, and the parse itself stays outside of the timing.
+    def setup():
+        clear_caches(module)
+        return module.parse() if phase != "parse" else None
+
+    if phase == "parse":
+        return setup, lambda _: module.parse()
+    return setup, getattr(module, phase)
+
+
+def time_phase(setup: Callable[[], Any], timed: Callable[[Any], Any], warmup: int, repeats: int) -> list[float]:
+    for _ in range(warmup):
+        timed(setup())
+    samples = []
+    for _ in range(repeats):
+        arg = setup()
+        start = time.perf_counter()
+        timed(arg)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def peak_memory(setup: Callable[[], Any], timed: Callable[[Any], Any]) -> int:
+    # Run separately from the timing runs, since tracemalloc slows everything down considerably
+    arg = setup()
+    tracemalloc.start()
+    try:
+        timed(arg)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_day(module: ModuleType, warmup: int, repeats: int, measure_memory: bool = True) -> dict[str, dict]:
+    results = {}
+    for phase in PHASES:
+        if not hasattr(module, phase):
+            continue
+        setup, timed = phase_runner(module, phase)
+        samples = time_phase(setup, timed, warmup, repeats)
+        results[phase] = {
+            "median": statistics.median(samples),
+            "p95": percentile(samples, 95),
+            "min": min(samples),
+            "runs": len(samples),
+        }
+        if measure_memory:
+            results[phase]["peak_bytes"] = peak_memory(setup, timed)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_delta: float = 0.0) -> list[str]:
+    # Flags any phase whose median got more than `threshold` (as a fraction) slower than the baseline's.  Phases that
+    # only take microseconds are mostly noise, so the slowdown also has to be at least `min_delta` seconds.
+    regressions = []
+    for day, phases in results["days"].items():
+        for phase, stats in phases.items():
+            old = baseline.get("days", {}).get(day, {}).get(phase)
+            if old is None:
+                continue
+            slower = stats["median"] - old["median"]
+            if stats["median"] > old["median"] * (1 + threshold) and slower >= min_delta:
+                change = stats["median"] / old["median"] - 1
+                regressions.append(f"day{day} {phase}: {old['median']:.6f}s -> {stats['median']:.6f}s (+{change:.1%})")
+    return regressions
+
+
+def print_table(results: dict, baseline: dict | None):
+    print(f"{'day':<6}{'phase':<10}{'median':>12}{'p95':>12}{'peak KiB':>12}{'vs base':>10}")
+    for day, phases in results["days"].items():
+        for phase, stats in phases.items():
+            old = (baseline or {}).get("days", {}).get(day, {}).get(phase)
+            delta = f"{stats['median'] / old['median'] - 1:+.1%}" if old and old["median"] else ""
+            peak = f"{stats['peak_bytes'] / 1024:.1f}" if "peak_bytes" in stats else ""
+            print(f"{day:<6}{phase:<10}{stats['median']:>12.6f}{stats['p95']:>12.6f}{peak:>12}{delta:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the advent2025 day modules")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all of them)")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="untimed runs before measuring")
+    parser.add_argument("-r", "--repeats", type=int, default=5, help="timed runs per phase")
+    parser.add_argument("-o", "--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory runs")
+    parser.add_argument("--baseline", nargs="?", type=Path, const=DEFAULT_BASELINE, help="baseline to compare to")
+    parser.add_argument("--save-baseline", nargs="?", type=Path, const=DEFAULT_BASELINE, help="save as baseline")
+    parser.add_argument("--input-dir", type=Path, help="read inputs from here instead (see generate_inputs.py)")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+    parser.add_argument("--min-delta", type=float, default=0.0005, help="ignore slowdowns under this many seconds")
+    args = parser.parse_args()
+
+    if args.input_dir:
+        set_input_dir(args.input_dir)
+    modules = day_modules()
+    days = sorted(args.days or modules)
+    results = {
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+        "input_dir": str(args.input_dir or ""),
+        "days": {},
+    }
+    for day in days:
+        module = importlib.import_module(modules[day])
+        results["days"][f"{day:02d}"] = bench_day(module, args.warmup, args.repeats, not args.no_memory)
+
+    args.output.write_text(json.dumps(results, indent=2))
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2))
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    print_table(results, baseline)
+    if baseline:
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
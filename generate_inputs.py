@@ -0,0 +1,254 @@
+import argparse
+import random
+import string
+from math import cos, isqrt, pi, sin
+from pathlib import Path
+from typing import Callable
+
+from utils import day_modules
+
+# Writes synthetic inputs in exactly the formats the day parsers expect, scaled up from the size of the real puzzle
+# inputs, so the solvers can be benchmarked far past what the puzzle files exercise.  For example:
+#   python generate_inputs.py --scale 100 --seed 1
+#   python benchmark.py --input-dir inputs/generated/x100
+# Every generator takes a size (number of records, or cells for the grids) and a seeded Random, so output is
+# reproducible for a given seed.
+
+DEFAULT_OUT_DIR = Path(__file__).parent / "inputs" / "generated"
+
+
+def gen_day01(size: int, rng: random.Random) -> str:
+    # Rotations, never zero since the dial always moves
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
+
+
+def gen_day02(size: int, rng: random.Random) -> str:
+    spans = []
+    for _ in range(size):
+        start = rng.randint(1, 10 ** rng.randint(1, 10))
+        spans.append(f"{start}-{start + rng.randint(0, start // 20 + 10)}")
+    return ",".join(spans)
+
+
+def gen_day03(size: int, rng: random.Random) -> str:
+    return "\n".join("".join(rng.choices("123456789", k=100)) for _ in range(size))
+
+
+def gen_day04(size: int, rng: random.Random) -> str:
+    side = max(isqrt(size), 1)
+    return "\n".join("".join("@" if rng.random() < 0.6 else "." for _ in range(side)) for _ in range(side))
+
+
+def gen_day05(size: int, rng: random.Random) -> str:
+    # Roughly the real input's mix of ranges to ingredients, with ranges that overlap every so often
+    num_ranges = max(size // 6, 1)
+    ranges = []
+    for _ in range(num_ranges):
+        start = rng.randint(1, 5 * 10**14)
+        ranges.append(f"{start}-{start + rng.randint(0, 10**12)}")
+    ingredients = (str(rng.randint(1, 5 * 10**14)) for _ in range(size - num_ranges))
+    return "\n".join(ranges) + "\n\n" + "\n".join(ingredients)
+
+
+def gen_day06(size: int, rng: random.Random) -> str:
+    rows: list[list[str]] = [[] for _ in range(4)]
+    ops = []
+    for _ in range(size):
+        width = rng.randint(1, 4)
+        # One of the numbers always uses the whole width, otherwise a blank column could split the problem in two
+        numbers = [str(rng.randint(10 ** (width - 1), 10**width - 1))]
+        numbers += [str(rng.randint(1, 10**width - 1)) for _ in range(3)]
+        # Each problem is aligned one way, and the digits in every column have to be contiguous so they read as a
+        # number top to bottom.  Ordering the numbers by length guarantees that.
+        numbers.sort(key=len, reverse=rng.random() < 0.5)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        ops.append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(x) for x in rows + [ops])
+
+
+def gen_day07(size: int, rng: random.Random) -> str:
+    side = max(isqrt(size) | 1, 3)
+    lines = ["S".center(side, ".")]
+    active = {side // 2}
+    for _ in range(side // 2):
+        lines.append("." * side)
+        # Splitters never sit on the edges, so split beams always stay inside the manifold.  Like the real inputs,
+        # every layer splits at least one beam and splitters are never side by side (beams from two neighboring
+        # splitters would land on each other's splitter, which the puzzle never defines).
+        splitters = {rng.choice(sorted(x for x in active if 0 < x < side - 1) or [side // 2])}
+        for x in range(1, side - 1):
+            if rng.random() < 0.15 and not {x - 1, x + 1} & splitters:
+                splitters.add(x)
+        hit = splitters & active
+        active = (active - hit) | {x - 1 for x in hit} | {x + 1 for x in hit}
+        lines.append("".join("^" if x in splitters else "." for x in range(side)))
+    return "\n".join(lines)
+
+
+def gen_day08(size: int, rng: random.Random) -> str:
+    points: set[tuple[int, int, int]] = set()
+    while len(points) < size:
+        points.add((rng.randint(0, 99999), rng.randint(0, 99999), rng.randint(0, 99999)))
+    return "\n".join(",".join(str(x) for x in point) for point in points)
+
+
+def gen_day09(size: int, rng: random.Random) -> str:
+    # Shaped like the real inputs: a staircase tracing around a circle, with a thin slot cut in from the left side
+    # almost all the way across.  Each point on the circle gives two corners, plus four more for the slot.
+    radius, num_points = max(48000, 100 * size), max((size - 4) // 2, 8)
+    center, gap = radius + 2000, radius // 70
+    circle = []
+    for angle in sorted(rng.uniform(0, 2 * pi) for _ in range(num_points)):
+        distance = radius * rng.uniform(0.98, 1.0)
+        point = (round(center + distance * cos(angle)), round(center + distance * sin(angle)))
+        # Leave room for the slot, and never repeat an x or y from the previous point so every corner is a real turn
+        if point[0] < center and abs(point[1] - center) <= 2 * gap:
+            continue
+        if circle and (point[0] == circle[-1][0] or point[1] == circle[-1][1]):
+            continue
+        circle.append(point)
+    if circle[0][0] == circle[-1][0] or circle[0][1] == circle[-1][1]:
+        circle.pop()
+    corners = []
+    for (x, y), (next_x, next_y) in zip(circle, circle[1:] + circle[:1]):
+        corners.append((x, y))
+        if y > center > next_y and x < center:
+            slot_end = center + radius * 9 // 10
+            corners += [(x, center + gap), (slot_end, center + gap), (slot_end, center - gap), (next_x, center - gap)]
+        else:
+            corners.append((x, next_y))
+    return "\n".join(f"{x},{y}" for x, y in corners)
+
+
+def gen_day10(size: int, rng: random.Random) -> str:
+    # Press counts get picked first and the joltages derived from them, so every machine is solvable
+    machines = []
+    for _ in range(size):
+        num_lights = rng.randint(3, 10)
+        num_buttons = rng.randint(3, min(num_lights + 3, 13))
+        buttons = [sorted(rng.sample(range(num_lights), rng.randint(1, num_lights))) for _ in range(num_buttons)]
+        # Make sure every light is hooked up to at least one button
+        for light in set(range(num_lights)) - {x for button in buttons for x in button}:
+            rng.choice(buttons).append(light)
+        buttons = [sorted(x) for x in buttons]
+        presses = [rng.randint(0, 40) for _ in buttons]
+        joltages = [sum(p for p, button in zip(presses, buttons) if light in button) for light in range(num_lights)]
+        lights = [False] * num_lights
+        for button in rng.sample(buttons, rng.randint(1, num_buttons)):
+            for light in button:
+                lights[light] = not lights[light]
+        desired = "".join("#" if x else "." for x in lights)
+        raw_buttons = " ".join(f"({','.join(str(x) for x in button)})" for button in buttons)
+        machines.append(f"[{desired}] {raw_buttons} {{{','.join(str(x) for x in joltages)}}}")
+    return "\n".join(machines)
+
+
+def gen_day11(size: int, rng: random.Random) -> str:
+    # A DAG built on a random topological order.  Every device feeds a few devices shortly after it, and a chain
+    # of guaranteed edges runs svr -> you -> fft -> dac -> out so both parts always have paths.
+    name_length = 3
+    while 26**name_length < size * 2:
+        name_length += 1
+    reserved = ["svr", "you", "fft", "dac", "out"]
+    names = set(reserved)
+    while len(names) < size:
+        names.add("".join(rng.choices(string.ascii_lowercase, k=name_length)))
+    order = rng.sample(sorted(names - set(reserved)), len(names) - len(reserved))
+    # Spread the waypoints out through the order, with out always last
+    for i, name in enumerate(reserved[:-1]):
+        order.insert((i * len(order)) // 4 + rng.randint(0, max(len(order) // 8, 1)), name)
+    order.append("out")
+    position = {name: i for i, name in enumerate(order)}
+    connections: dict[str, set[str]] = {name: set() for name in order[:-1]}
+    for i, name in enumerate(order[:-1]):
+        window = order[i + 1 : i + 40]
+        connections[name].update(rng.sample(window, min(len(window), rng.randint(1, 4))))
+    for first, second in zip(reserved, reserved[1:]):
+        # Link each waypoint to the next one through a few devices in between
+        between = order[position[first] + 1 : position[second]]
+        chain = [first] + sorted(rng.sample(between, min(len(between), 3)), key=position.get) + [second]
+        for a, b in zip(chain, chain[1:]):
+            connections[a].add(b)
+    lines = [f"{name}: {' '.join(sorted(outputs))}" for name, outputs in connections.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def gen_day12(size: int, rng: random.Random) -> str:
+    patterns = []
+    for i in range(6):
+        filled = rng.randint(5, 7)
+        cells = ["#"] * filled + ["."] * (9 - filled)
+        rng.shuffle(cells)
+        # Keep the middle filled in so the shape stays in one piece, like the real ones
+        cells[4] = "#"
+        patterns.append(f"{i}:\n" + "\n".join("".join(cells[y * 3 : y * 3 + 3]) for y in range(3)))
+    fields = []
+    for _ in range(size):
+        size_x, size_y = rng.randint(35, 50), rng.randint(35, 50)
+        # Aim the total piece area around the field size, so some fit and some don't
+        budget = size_x * size_y * rng.uniform(0.8, 1.1) / 6
+        counts = [max(int(budget / 6 * rng.uniform(0.5, 1.5)), 0) for _ in range(6)]
+        fields.append(f"{size_x}x{size_y}: {' '.join(str(x) for x in counts)}")
+    return "\n\n".join(patterns) + "\n\n" + "\n".join(fields)
+
+
+GENERATORS: dict[int, Callable[[int, random.Random], str]] = {
+    1: gen_day01,
+    2: gen_day02,
+    3: gen_day03,
+    4: gen_day04,
+    5: gen_day05,
+    6: gen_day06,
+    7: gen_day07,
+    8: gen_day08,
+    9: gen_day09,
+    10: gen_day10,
+    11: gen_day11,
+    12: gen_day12,
+}
+
+# Roughly the size of the real puzzle inputs, in whatever units each generator's size is in
+BASE_SIZES = {
+    1: 4800,
+    2: 35,
+    3: 200,
+    4: 136 * 136,
+    5: 1200,
+    6: 1000,
+    7: 141 * 141,
+    8: 1000,
+    9: 496,
+    10: 175,
+    11: 570,
+    12: 1000,
+}
+
+
+def generate(day: int, scale: float, seed: int, out_dir: Path) -> Path:
+    # Mixing the day into the seed keeps every day's input independent for a given seed
+    rng = random.Random(f"{seed}-{day}")
+    filename = out_dir / f"{day_modules()[day]}_input.txt"
+    filename.write_text(GENERATORS[day](max(int(BASE_SIZES[day] * scale), 1), rng))
+    return filename
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate scaled-up synthetic inputs for the advent2025 days")
+    parser.add_argument("days", nargs="*", type=int, help="days to generate (default: all of them)")
+    parser.add_argument("-s", "--scale", type=float, default=10, help="size relative to the real puzzle input")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--out-dir", type=Path, help=f"default: {DEFAULT_OUT_DIR}/x<scale>")
+    args = parser.parse_args()
+
+    out_dir = args.out_dir or DEFAULT_OUT_DIR / f"x{args.scale:g}"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for day in sorted(args.days or GENERATORS):
+        filename = generate(day, args.scale, args.seed, out_dir)
+        print(f"Day {day:02d}: {filename} ({filename.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,10 +26,24 @@ blank_day = """from utils import read_data
 import time
 
 
-def main():
+def parse():
+    return read_data()
+
+
+def part_one(parsed) -> int:
     pass
 
 
+def part_two(parsed) -> int:
+    pass
+
+
+def main():
+    parsed = parse()
+    print(f"Part one: {part_one(parsed)}")
+    print(f"Part two: {part_two(parsed)}")
+
+
 if __name__ == "__main__":
     timer_start = time.monotonic()
     main()
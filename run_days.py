@@ -0,0 +1,104 @@
+import argparse
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from utils import (
+    day_modules,
+    enable_instrumentation,
+    instrumentation_report,
+    phase,
+    reset_instrumentation,
+    set_input_dir,
+)
+
+# Runs any subset of the days (all of them by default) concurrently in a process pool, e.g.:
+#   python run_days.py                 (every day, one worker per core)
+#   python run_days.py 8 9 10 -j 2     (just those days, two workers)
+
+# These dominate the total runtime, so they get submitted first to overlap with everything else
+HEAVY_DAYS = (10, 9, 8)
+
+
+class DayResult(NamedTuple):
+    day: int
+    part_one: Any
+    part_two: Any
+    phases: dict[str, float]
+    wall: float
+    cpu: float
+    report: dict | None = None
+
+
+def run_day(day: int, instrument: str | None = None) -> DayResult:
+    # Worker processes don't run atexit hooks, so instrumentation reports get collected per day and sent back instead
+    if instrument:
+        enable_instrumentation(track_memory=instrument == "mem", report_at_exit=False)
+        reset_instrumentation()
+    module = importlib.import_module(day_modules()[day])
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    phases = {}
+    answers = {}
+    start = time.perf_counter()
+    with phase(f"day{day:02d}.parse"):
+        parsed = module.parse()
+    phases["parse"] = time.perf_counter() - start
+    for name in ("part_one", "part_two"):
+        if not hasattr(module, name):
+            continue
+        start = time.perf_counter()
+        with phase(f"day{day:02d}.{name}"):
+            answers[name] = getattr(module, name)(parsed)
+        phases[name] = time.perf_counter() - start
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    report = instrumentation_report() if instrument else None
+    return DayResult(day, answers.get("part_one"), answers.get("part_two"), phases, wall, cpu, report)
+
+
+def run_days(days: list[int], workers: int | None = None, instrument: str | None = None) -> list[DayResult]:
+    submit_order = [x for x in HEAVY_DAYS if x in days] + [x for x in days if x not in HEAVY_DAYS]
+    if workers == 1:
+        results = {x: run_day(x, instrument) for x in submit_order}
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {x: pool.submit(run_day, x, instrument) for x in submit_order}
+            results = {x: future.result() for x, future in futures.items()}
+    # Always report in day order, no matter what order they finished in
+    return [results[x] for x in sorted(days)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run advent2025 days in parallel")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all of them)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="worker processes (1 = serial)")
+    parser.add_argument(
+        "--instrument", nargs="?", const="on", choices=("on", "mem"), help="report phases, counters and caches per day"
+    )
+    parser.add_argument("--input-dir", type=Path, help="read inputs from here instead (see generate_inputs.py)")
+    args = parser.parse_args()
+    if args.input_dir:
+        set_input_dir(args.input_dir)
+
+    days = sorted(args.days or day_modules())
+    wall_start = time.perf_counter()
+    results = run_days(days, args.workers, args.instrument)
+    total_wall = time.perf_counter() - wall_start
+
+    for result in results:
+        phases = " ".join(f"{k}={v:.4f}s" for k, v in result.phases.items())
+        answers = f"part one {result.part_one}"
+        if "part_two" in result.phases:
+            answers += f", part two {result.part_two}"
+        print(f"Day {result.day:02d}: {answers} ({phases})")
+    total_cpu = sum(x.cpu for x in results)
+    print(f"Wall time: {total_wall:.4f}s, summed CPU time: {total_cpu:.4f}s ({total_cpu / total_wall:.2f}x)")
+    if args.instrument:
+        print(json.dumps({f"{x.day:02d}": x.report for x in results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,322 @@
 from pathlib import Path
-from typing import NamedTuple, Iterator, Iterable, Type, Tuple, Self
-import inspect
+from typing import NamedTuple, Iterator, Iterable, Type, Tuple, Self, Callable, Sequence
+from array import array
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ContextDecorator
+from functools import cache, wraps
+from heapq import heapify, heappop, heappush
+from itertools import batched
+from math import sqrt, prod
+import atexit
+import hashlib
+import json
+import mmap
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ADVENT_INPUT_DIR points every day at a different set of inputs, like the ones generate_inputs.py writes out
+INPUT_DIR = Path(os.environ.get("ADVENT_INPUT_DIR", Path(__file__).parent / "inputs"))
+
+# Process-level cache of loaded inputs, so repeated runs of a day in one process never touch the filesystem again
+_TEXT_CACHE: dict[Path, str] = {}
+_BYTES_CACHE: dict[Path, memoryview] = {}
+
+
+def set_input_dir(directory: Path):
+    global INPUT_DIR
+    INPUT_DIR = directory.resolve()
+    # Also goes in the environment so any worker processes we start end up looking in the same place
+    os.environ["ADVENT_INPUT_DIR"] = str(INPUT_DIR)
+
+
+def input_path(day: int | None = None, depth: int = 1) -> Path:
+    if day is not None:
+        return INPUT_DIR / f"advent2025_day{day:02d}_input.txt"
+    # sys._getframe only walks frame pointers, unlike inspect.stack() which builds every frame record and reads source
+    caller_filename = sys._getframe(depth).f_globals["__file__"]
+    return INPUT_DIR / f"{Path(caller_filename).stem}_input.txt"
 
 
 # Grab my input data from the automatically-named file generated by get_data.py
-def read_data():
-    caller_filename = inspect.stack()[1].filename
-    filename = Path(f"inputs/{Path(caller_filename).stem}_input.txt")
-    return filename.read_text()
+def read_data(day: int | None = None) -> str:
+    filename = input_path(day, depth=2)
+    if filename not in _TEXT_CACHE:
+        _TEXT_CACHE[filename] = filename.read_text()
+    return _TEXT_CACHE[filename]
+
+
+# Same as read_data, but hands back a read-only view over an mmap of the file so big inputs never get copied
+def read_bytes(day: int | None = None) -> memoryview:
+    filename = input_path(day, depth=2)
+    if filename not in _BYTES_CACHE:
+        with filename.open("rb") as f:
+            # mmap refuses to map empty files
+            if filename.stat().st_size == 0:
+                _BYTES_CACHE[filename] = memoryview(b"")
+            else:
+                _BYTES_CACHE[filename] = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    return _BYTES_CACHE[filename]
+
+
+def _apply_chunk[T, R](func: Callable[[T], R], chunk: tuple[T, ...]) -> list[R]:
+    return [func(x) for x in chunk]
+
+
+# Maps func over records in a process pool, a chunk of records per task, and yields the results in input order so any
+# reduction over them comes out the same every time.  Runs serially if there's only one worker or one chunk's worth of
+# records, or if we're already inside a worker process (e.g. under run_days.py) so pools don't pile up on each other.
+def parallel_map[T, R](
+    func: Callable[[T], R], records: Iterable[T], workers: int | None = None, chunk_size: int = 32
+) -> Iterator[R]:
+    workers = workers or int(os.environ.get("ADVENT_WORKERS", 0)) or os.cpu_count() or 1
+    chunks = batched(records, chunk_size)
+    first_chunk = next(chunks, ())
+    if workers <= 1 or len(first_chunk) < chunk_size or multiprocessing.parent_process() is not None:
+        yield from map(func, first_chunk)
+        for chunk in chunks:
+            yield from map(func, chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque([pool.submit(_apply_chunk, func, first_chunk)])
+        for chunk in chunks:
+            pending.append(pool.submit(_apply_chunk, func, chunk))
+            # Only keep a couple of chunks per worker in flight, so a streamed input never gets read in all at once
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+# Instrumentation is off unless ADVENT_INSTRUMENT is set (to "mem" to also track tracemalloc peaks per phase) or
+# enable_instrumentation() gets called.  While it's off, phases and counters cost a single flag check.
+_INSTRUMENTING = False
+_TRACK_MEMORY = False
+_PHASE_TIMES: dict[str, list[float]] = defaultdict(list)
+_PHASE_PEAKS: dict[str, int] = {}
+_PEAK_STACK: list[int] = []
+_COUNTERS: Counter[str] = Counter()
+_CACHES: dict[str, Callable] = {}
+
+
+def enable_instrumentation(track_memory: bool = False, report_at_exit: bool = True):
+    global _INSTRUMENTING, _TRACK_MEMORY
+    if report_at_exit and not _INSTRUMENTING:
+        atexit.register(_report_at_exit)
+    _INSTRUMENTING, _TRACK_MEMORY = True, track_memory
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def reset_instrumentation():
+    _PHASE_TIMES.clear()
+    _PHASE_PEAKS.clear()
+    _COUNTERS.clear()
+    _CACHES.clear()
+    _PEAK_STACK.clear()
+
+
+class phase(ContextDecorator):
+    # Times a named phase, as either a `with phase("name"):` block or an `@phase("name")` decorator
+    def __init__(self, name: str):
+        self.name = name
+        # As a decorator the same instance gets entered for every call, so recursive calls each need their own start
+        self.starts: list[float] = []
+
+    def __enter__(self) -> Self:
+        if _INSTRUMENTING:
+            if _TRACK_MEMORY:
+                # tracemalloc only has the one peak, so nested phases hand their peaks back up to their parents, and
+                # the parent's peak so far gets saved before the child resets it
+                if _PEAK_STACK:
+                    _PEAK_STACK[-1] = max(_PEAK_STACK[-1], tracemalloc.get_traced_memory()[1])
+                _PEAK_STACK.append(0)
+                tracemalloc.reset_peak()
+            self.starts.append(time.perf_counter())
+        return self
+
+    def __exit__(self, *exc_info):
+        if _INSTRUMENTING and self.starts:
+            _PHASE_TIMES[self.name].append(time.perf_counter() - self.starts.pop())
+            if _TRACK_MEMORY and _PEAK_STACK:
+                peak = max(tracemalloc.get_traced_memory()[1], _PEAK_STACK.pop())
+                _PHASE_PEAKS[self.name] = max(_PHASE_PEAKS.get(self.name, 0), peak)
+                if _PEAK_STACK:
+                    _PEAK_STACK[-1] = max(_PEAK_STACK[-1], peak)
+        return False
+
+
+def count(name: str, amount: int = 1):
+    if _INSTRUMENTING:
+        _COUNTERS[name] += amount
+
+
+# Registers a functools.cache/lru_cache-wrapped function so its hits, misses and size show up in the report.
+# Returns the function untouched, so it can sit on top of @cache as a decorator without adding any overhead.
+def track_cache[F: Callable](func: F, name: str | None = None) -> F:
+    _CACHES[name or func.__qualname__] = func
+    return func
+
+
+def instrumentation_report() -> dict:
+    phases = {}
+    for name, times in _PHASE_TIMES.items():
+        phases[name] = {"calls": len(times), "total": sum(times), "mean": sum(times) / len(times), "max": max(times)}
+        if name in _PHASE_PEAKS:
+            phases[name]["peak_bytes"] = _PHASE_PEAKS[name]
+    caches = {name: func.cache_info()._asdict() for name, func in _CACHES.items()}
+    return {"phases": phases, "counters": dict(_COUNTERS), "caches": caches}
+
+
+def _report_at_exit():
+    # Goes to ADVENT_INSTRUMENT_OUT if that's set, otherwise stderr so it doesn't get mixed up with the answers
+    report = json.dumps(instrumentation_report(), indent=2)
+    if os.environ.get("ADVENT_INSTRUMENT_OUT"):
+        Path(os.environ["ADVENT_INSTRUMENT_OUT"]).write_text(report)
+    else:
+        print(report, file=sys.stderr)
+
+
+if os.environ.get("ADVENT_INSTRUMENT"):
+    enable_instrumentation(track_memory=os.environ["ADVENT_INSTRUMENT"] == "mem")
+
+
+PARSE_CACHE_DIR = Path(__file__).parent / ".parse_cache"
+
+
+@cache
+def _code_version(module_filename: str) -> str:
+    # Any edit to the parsing module or to utils changes this, which is what invalidates old cached parses
+    digest = hashlib.sha256(Path(module_filename).read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+# Persists whatever a day's no-argument parse function returns to PARSE_CACHE_DIR as a pickle, keyed by a hash of the
+# day's input file and the code version above, so warm runs skip straight to solving.  A cache file only gets reused
+# when the input and the code both match exactly; stale ones for the same function are cleared out whenever a new one
+# is written.  Set ADVENT_PARSE_CACHE=0 to bypass it.
+def cached_parse[T](func: Callable[[], T]) -> Callable[[], T]:
+    @wraps(func)
+    def wrapper() -> T:
+        if os.environ.get("ADVENT_PARSE_CACHE") == "0":
+            return func()
+        module_filename = sys.modules[func.__module__].__file__
+        stem = Path(module_filename).stem
+        with (INPUT_DIR / f"{stem}_input.txt").open("rb") as f:
+            digest = hashlib.file_digest(f, "sha256")
+        digest.update(_code_version(module_filename).encode())
+        # Pickles refer to classes by module name, and a day run as a script is __main__ rather than its own name, so
+        # each gets its own cache file
+        prefix = f"{stem}-{func.__module__}-{func.__name__}-"
+        filename = PARSE_CACHE_DIR / f"{prefix}{digest.hexdigest()[:32]}.pickle"
+        if filename.exists():
+            with filename.open("rb") as f:
+                return pickle.load(f)
+        result = func()
+        PARSE_CACHE_DIR.mkdir(exist_ok=True)
+        for stale in PARSE_CACHE_DIR.glob(f"{prefix}*.pickle"):
+            stale.unlink(missing_ok=True)
+        # Write under a temporary name first, so a parallel run never sees a half-written file
+        temp_filename = filename.with_suffix(f".{os.getpid()}.tmp")
+        with temp_filename.open("wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_filename.replace(filename)
+        return result
+
+    return wrapper
+
+
+# Every advent2025_dayNN module sitting next to this file, keyed by day number
+def day_modules() -> dict[int, str]:
+    return {int(x.stem[-2:]): x.stem for x in sorted(Path(__file__).parent.glob("advent2025_day[0-9][0-9].py"))}
+
+
+def clear_input_cache():
+    _TEXT_CACHE.clear()
+    # Views have to be released before their mmaps can be closed
+    for view in _BYTES_CACHE.values():
+        backing = view.obj
+        view.release()
+        if isinstance(backing, mmap.mmap):
+            backing.close()
+    _BYTES_CACHE.clear()
+
+
+# Big enough that the per-chunk overhead vanishes, small enough that memory use is flat regardless of input size
+STREAM_CHUNK_SIZE = 1 << 16
+
+
+class InputStream[T]:
+    # A re-iterable view of an input file.  Every pass re-reads the file in fixed-size chunks, so no more than one
+    # chunk plus one record is ever held in memory, and it can be handed to several consumers like a list could.
+    def __init__(self, source: Callable[[], Iterator[T]]):
+        self._source = source
+
+    def __iter__(self) -> Iterator[T]:
+        return self._source()
+
+    def map[U](self, func: Callable[[T], U]) -> "InputStream[U]":
+        return InputStream(lambda: map(func, self._source()))
+
+
+def _iter_split(filename: Path, sep: str, chunk_size: int) -> Iterator[str]:
+    raw_sep = sep.encode()
+    remainder = b""
+    with filename.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            chunk = remainder + chunk
+            # Only decode up to the last separator, so multi-byte characters never get cut in half
+            cut = chunk.rfind(raw_sep)
+            if cut == -1:
+                remainder = chunk
+                continue
+            remainder = chunk[cut + len(raw_sep) :]
+            yield from chunk[:cut].decode().split(sep)
+    if remainder:
+        yield remainder.decode()
+
+
+def _iter_blocks(filename: Path, chunk_size: int) -> Iterator[str]:
+    block: list[str] = []
+    for line in _iter_split(filename, "\n", chunk_size):
+        if line:
+            block.append(line)
+        elif block:
+            yield "\n".join(block)
+            block = []
+    if block:
+        yield "\n".join(block)
+
+
+# Streaming equivalent of read_data().splitlines()
+def stream_lines(day: int | None = None, chunk_size: int = STREAM_CHUNK_SIZE) -> InputStream[str]:
+    filename = input_path(day, depth=2)
+    return InputStream(lambda: _iter_split(filename, "\n", chunk_size))
+
+
+# Streaming equivalent of read_data().split("\n\n"), minus the trailing newline.  Each block is held in memory.
+def stream_blocks(day: int | None = None, chunk_size: int = STREAM_CHUNK_SIZE) -> InputStream[str]:
+    filename = input_path(day, depth=2)
+    return InputStream(lambda: _iter_blocks(filename, chunk_size))
+
+
+# Streaming equivalent of read_data().split(delimiter), with surrounding whitespace and empty tokens dropped
+def stream_tokens(
+    delimiter: str = ",", day: int | None = None, chunk_size: int = STREAM_CHUNK_SIZE
+) -> InputStream[str]:
+    filename = input_path(day, depth=2)
+    tokens = lambda: (x.strip() for x in _iter_split(filename, delimiter, chunk_size) if x.strip())
+    return InputStream(tokens)
 
 
 class BaseCoord(NamedTuple):
@@ -71,6 +380,143 @@ class BaseCoord3D(NamedTuple):
         return f"Coord3D(x={self.x}, y={self.y}, z={self.z})"
 
 
+def _column(values: Iterable[int]):
+    if np is None:
+        return array("q", values)
+    if isinstance(values, np.ndarray):
+        return values.astype(np.int64, copy=False)
+    return np.fromiter(values, dtype=np.int64)
+
+
+class CoordArray:
+    # Struct-of-arrays counterpart to BaseCoord/BaseCoord3D: one int column per axis, numpy arrays when numpy is
+    # installed and array("q") otherwise.  Batch math on it is a handful of column operations instead of one
+    # NamedTuple allocation per point (or per pair of points, for the pairwise helpers).
+    def __init__(self, ys: Iterable[int], xs: Iterable[int], zs: Iterable[int] | None = None):
+        self.ys, self.xs = _column(ys), _column(xs)
+        self.zs = None if zs is None else _column(zs)
+
+    @classmethod
+    def from_coords(cls, coords: Iterable[BaseCoord | BaseCoord3D]) -> Self:
+        coords = list(coords)
+        if coords and isinstance(coords[0], BaseCoord3D):
+            return cls((c.y for c in coords), (c.x for c in coords), (c.z for c in coords))
+        return cls((c.y for c in coords), (c.x for c in coords))
+
+    @property
+    def columns(self) -> tuple:
+        return (self.ys, self.xs) if self.zs is None else (self.ys, self.xs, self.zs)
+
+    def __len__(self) -> int:
+        return len(self.ys)
+
+    def __getitem__(self, index: int) -> BaseCoord | BaseCoord3D:
+        if self.zs is None:
+            return BaseCoord(y=int(self.ys[index]), x=int(self.xs[index]))
+        return BaseCoord3D(y=int(self.ys[index]), x=int(self.xs[index]), z=int(self.zs[index]))
+
+    def __iter__(self) -> Iterator[BaseCoord | BaseCoord3D]:
+        yield from (self[i] for i in range(len(self)))
+
+    def _elementwise(self, other: Self | BaseCoord | BaseCoord3D, func: Callable[[int, int], int]) -> Self:
+        # Works against another CoordArray of the same length, or broadcasts a single coord across every row
+        if isinstance(other, CoordArray):
+            others = other.columns
+        else:
+            others = (other.y, other.x) if len(other) == 2 else (other.y, other.x, other.z)
+        if np is not None:
+            return self.__class__(*(func(a, b) for a, b in zip(self.columns, others)))
+        if isinstance(other, CoordArray):
+            return self.__class__(*((func(x, y) for x, y in zip(a, b)) for a, b in zip(self.columns, others)))
+        return self.__class__(*((func(x, b) for x in a) for a, b in zip(self.columns, others)))
+
+    def __add__(self, other: Self | BaseCoord | BaseCoord3D) -> Self:
+        return self._elementwise(other, lambda a, b: a + b)
+
+    def __sub__(self, other: Self | BaseCoord | BaseCoord3D) -> Self:
+        return self._elementwise(other, lambda a, b: a - b)
+
+    def distance(self, other: BaseCoord | BaseCoord3D) -> Sequence[int]:
+        # Manhattan distance from every point to `other`
+        return self._combine(list((self - other).columns), "manhattan")
+
+    def straight_dist(self, other: BaseCoord | BaseCoord3D) -> Sequence[float]:
+        # Euclidean distance from every point to `other`
+        return self._combine(list((self - other).columns), "euclidean")
+
+    @staticmethod
+    def _combine(deltas: list, metric: str):
+        # Folds per-axis deltas (numpy arrays of any shape, or flat lists of ints) into a single `metric` value each
+        if np is not None:
+            if metric == "manhattan":
+                return sum(np.abs(x) for x in deltas)
+            if metric == "area":
+                return prod(np.abs(x) + 1 for x in deltas)
+            squared = sum(x * x for x in deltas)
+            return np.sqrt(squared) if metric == "euclidean" else squared
+        # Without numpy, fold one axis at a time so the inner loops all stay inside comprehensions
+        first, *rest = deltas
+        if metric == "manhattan":
+            combined = [abs(x) for x in first]
+            for axis in rest:
+                combined = [a + abs(x) for a, x in zip(combined, axis)]
+        elif metric == "area":
+            combined = [abs(x) + 1 for x in first]
+            for axis in rest:
+                combined = [a * (abs(x) + 1) for a, x in zip(combined, axis)]
+        else:
+            combined = [x * x for x in first]
+            for axis in rest:
+                combined = [a + x * x for a, x in zip(combined, axis)]
+            if metric == "euclidean":
+                combined = [sqrt(x) for x in combined]
+        return combined
+
+    def pairwise(self, metric: str = "manhattan"):
+        # n*n matrix of `metric` between every pair: "manhattan", "squared" (squared euclidean), "euclidean", or
+        # "area" (the inclusive area of the rectangle with the two points as opposite corners, like day09's Coord.area)
+        if np is not None:
+            return self._combine([x[:, None] - x[None, :] for x in self.columns], metric)
+        columns = self.columns
+        return [self._combine([[c[i] - x for x in c] for c in columns], metric) for i in range(len(self))]
+
+    def pairwise_areas(self):
+        return self.pairwise("area")
+
+    def sorted_pairs(self, metric: str = "manhattan", reverse: bool = False) -> Iterator[tuple[int, int]]:
+        # Index pairs (i < j) ordered by `metric`, in the same order sorted(combinations(...), key=...) would give
+        if np is not None:
+            first, second = np.triu_indices(len(self), k=1)
+            values = self._combine([x[first] - x[second] for x in self.columns], metric)
+            order = np.argsort(-values if reverse else values, kind="stable")
+            yield from zip(first[order].tolist(), second[order].tolist())
+            return
+        # Without numpy, merge the rows lazily: each anchor i only gets its partners sorted once the heap reaches
+        # its best pair, so taking the first few pairs never builds all n*n/2 of them.  Heap entries are
+        # (key, i, j) with j = -1 standing in for a not-yet-expanded row, which keeps ties in (i, j) order.
+        columns, sign = self.columns, -1 if reverse else 1
+        rows: dict[int, Iterator[tuple[int, int]]] = {}
+        heap = []
+        for i in range(len(self) - 1):
+            row = self._combine([[c[i] - x for x in c[i + 1 :]] for c in columns], metric)
+            heap.append((sign * (max(row) if reverse else min(row)), i, -1))
+        heapify(heap)
+        while heap:
+            key, i, j = heappop(heap)
+            if j == -1:
+                row = self._combine([[c[i] - x for x in c[i + 1 :]] for c in columns], metric)
+                rows[i] = iter(sorted((sign * value, i + 1 + k) for k, value in enumerate(row)))
+            else:
+                yield i, j
+            if (entry := next(rows[i], None)) is None:
+                del rows[i]
+            else:
+                heappush(heap, (entry[0], i, entry[1]))
+
+    def __repr__(self) -> str:
+        return f"CoordArray({list(self)})"
+
+
 ALL_NEIGHBORS_2D = tuple(BaseCoord(x=x, y=y) for x in range(-1, 2) for y in range(-1, 2) if (x, y) != (0, 0))
 ALL_NEIGHBORS_3D = tuple(
     BaseCoord3D(x=x, y=y, z=z)
@@ -81,3 +527,66 @@ ALL_NEIGHBORS_3D = tuple(
 )
 CARDINAL_NEIGHBORS_2D = tuple(x for x in ALL_NEIGHBORS_2D if not (abs(x.x) == abs(x.y)))
 CARDINAL_NEIGHBORS_3D = tuple(x for x in ALL_NEIGHBORS_3D if abs(x.x) + abs(x.y) + abs(x.z) == 1)
+
+
+class Grid:
+    # A dense grid of one-byte cells, stored flat in a bytearray with a one-cell border of `fill` all the way around.
+    # Cells are addressed by a single int, (y + 1) * stride + (x + 1), and thanks to the border every real cell's
+    # neighbors are just that int plus a precomputed offset, with no bounds checks and no Coord allocations.
+    def __init__(self, width: int, height: int, fill: int = 0):
+        self.width, self.height = width, height
+        self.stride = width + 2
+        self.fill = fill
+        self.cells = bytearray([fill]) * (self.stride * (height + 2))
+        # Same ordering as ALL_NEIGHBORS_2D/CARDINAL_NEIGHBORS_2D, just flattened
+        self.all_offsets = tuple(n.y * self.stride + n.x for n in ALL_NEIGHBORS_2D)
+        self.cardinal_offsets = tuple(n.y * self.stride + n.x for n in CARDINAL_NEIGHBORS_2D)
+
+    @classmethod
+    def from_text(cls, raw: str | bytes | memoryview, fill: int = 0) -> Self:
+        lines = (raw.encode() if isinstance(raw, str) else bytes(raw)).splitlines()
+        grid = cls(max((len(x) for x in lines), default=0), len(lines), fill)
+        for y, line in enumerate(lines):
+            # Copy a whole row at a time rather than char by char
+            start = grid.index(0, y)
+            grid.cells[start : start + len(line)] = line
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def coord[T: BaseCoord](self, index: int, cls: Type[T] = BaseCoord) -> T:
+        y, x = divmod(index, self.stride)
+        return cls(x=x - 1, y=y - 1)
+
+    def row(self, y: int) -> slice:
+        start = self.index(0, y)
+        return slice(start, start + self.width)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int):
+        self.cells[index] = value
+
+    def find(self, value: int) -> Iterator[int]:
+        # bytearray.find does the scanning in C, which beats enumerating every cell in Python by a wide margin
+        cells, pos = self.cells, self.cells.find(value)
+        while pos != -1:
+            yield pos
+            pos = cells.find(value, pos + 1)
+
+    def neighbors(self, index: int) -> Iterator[int]:
+        yield from (index + x for x in self.all_offsets)
+
+    def cardinal_neighbors(self, index: int) -> Iterator[int]:
+        yield from (index + x for x in self.cardinal_offsets)
+
+    def as_array(self):
+        # Zero-copy (height + 2, stride) view including the border, for when numpy is around
+        if np is None:
+            raise ImportError("Grid.as_array() needs numpy installed")
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height + 2, self.stride)
+
+    def __repr__(self) -> str:
+        return "\n".join(self.cells[self.row(y)].decode(errors="replace") for y in range(self.height))